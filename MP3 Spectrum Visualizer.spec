@@ -4,7 +4,7 @@ from PyInstaller.utils.hooks import collect_all
 datas = [('core', 'core'), ('gui', 'gui')]
 binaries = []
 hiddenimports = [
-    'PyQt5', 'librosa', 'numpy', 'PIL', 'ffmpeg', 'soundfile',
+    'PyQt5', 'librosa', 'numpy', 'PIL', 'soundfile',
     'cv2', 'scipy', 'numba'
 ]
 tmp_ret = collect_all('librosa')
@@ -30,7 +30,6 @@ pyinstaller --name="MP3 Spectrum Visualizer" \
     --hidden-import=librosa \
     --hidden-import=numpy \
     --hidden-import=PIL \
-    --hidden-import=ffmpeg \
     --hidden-import=soundfile \
     --collect-all=librosa \
     --collect-all=numpy \
@@ -5,7 +5,8 @@ Handles audio loading, spectrum analysis, and timing information.
 
 import librosa
 import numpy as np
-from typing import Tuple, List, Optional
+import scipy.fft
+from typing import Tuple, List, Optional, Dict
 
 
 class AudioProcessor:
@@ -23,6 +24,7 @@ class AudioProcessor:
         self.sample_rate: Optional[int] = None
         self.duration: Optional[float] = None
         self._spectrum_cache: Optional[np.ndarray] = None
+        self._bands_cache: Dict[Tuple[int, int], np.ndarray] = {}
         self._beat_frames: Optional[np.ndarray] = None
         self._beat_times: Optional[np.ndarray] = None
         self._tempo: Optional[float] = None
@@ -74,8 +76,10 @@ class AudioProcessor:
         # Calculate hop length for frame-by-frame analysis
         hop_length = len(audio_data) // num_frames if num_frames > 0 else 512
         
-        # Compute short-time Fourier transform
-        stft = librosa.stft(audio_data, n_fft=n_fft, hop_length=hop_length)
+        # Compute short-time Fourier transform (librosa uses scipy.fft,
+        # let it spread the transforms across all cores)
+        with scipy.fft.set_workers(-1):
+            stft = librosa.stft(audio_data, n_fft=n_fft, hop_length=hop_length)
         magnitude = np.abs(stft)
         
         # Resample to match exact number of frames
@@ -89,6 +93,10 @@ class AudioProcessor:
                 resampled[i] = np.interp(target_indices, original_indices, magnitude[i])
             magnitude = resampled
         
+        # Store frame-major (Fortran order) so each frame's spectrum column,
+        # read once per video frame, is contiguous in memory
+        magnitude = np.asfortranarray(magnitude)
+        
         self._spectrum_cache = magnitude
         return magnitude
     
@@ -103,6 +111,10 @@ class AudioProcessor:
         Returns:
             Array of shape (num_frames, num_bands) with band magnitudes
         """
+        cache_key = (num_bands, frame_rate)
+        if cache_key in self._bands_cache:
+            return self._bands_cache[cache_key]
+        
         spectrum = self.compute_spectrum(frame_rate=frame_rate)
         n_fft = spectrum.shape[0]
         
@@ -118,6 +130,7 @@ class AudioProcessor:
             if start_bin < end_bin:
                 bands[:, i] = np.mean(spectrum[start_bin:end_bin, :].T, axis=1)
         
+        self._bands_cache[cache_key] = bands
         return bands
     
     def get_frame_spectrum(self, frame_number: int, frame_rate: int = 30) -> np.ndarray:
@@ -191,7 +204,8 @@ class AudioProcessor:
         audio_data, sr = self.load_audio()
         
         # Detect tempo and beat frames
-        tempo, beat_frames = librosa.beat.beat_track(y=audio_data, sr=sr)
+        with scipy.fft.set_workers(-1):
+            tempo, beat_frames = librosa.beat.beat_track(y=audio_data, sr=sr)
         
         # Convert tempo from array to float if needed
         if isinstance(tempo, np.ndarray):
@@ -289,6 +303,35 @@ class AudioProcessor:
         
         return 0.0
     
+    def get_beat_strengths(self, num_frames: int, frame_rate: int = 30) -> np.ndarray:
+        """
+        Get beat strength for every frame at once (see get_beat_strength).
+        
+        Args:
+            num_frames: Number of frames
+            frame_rate: Video frame rate
+            
+        Returns:
+            Array of shape (num_frames,) with beat strengths (0.0 to 1.0)
+        """
+        beat_times = np.sort(self.get_beat_times())
+        if len(beat_times) == 0:
+            return np.zeros(num_frames)
+        
+        frame_times = np.arange(num_frames) / frame_rate
+        
+        # Distance to the closest beat on either side
+        next_index = np.clip(np.searchsorted(beat_times, frame_times), 0, len(beat_times) - 1)
+        prev_index = np.clip(next_index - 1, 0, len(beat_times) - 1)
+        min_diff = np.minimum(np.abs(beat_times[next_index] - frame_times),
+                              np.abs(beat_times[prev_index] - frame_times))
+        
+        # Convert to frame difference and apply the same decay
+        frame_diff = min_diff * frame_rate
+        strengths = np.clip(np.exp(-frame_diff / 3.0), 0.0, 1.0)
+        strengths[frame_diff >= 10] = 0.0
+        return strengths
+    
     def compute_onset_envelope(self) -> np.ndarray:
         """
         Compute onset strength envelope for rhythm analysis.
@@ -302,7 +345,8 @@ class AudioProcessor:
         audio_data, sr = self.load_audio()
         
         # Compute onset strength
-        onset_env = librosa.onset.onset_strength(y=audio_data, sr=sr)
+        with scipy.fft.set_workers(-1):
+            onset_env = librosa.onset.onset_strength(y=audio_data, sr=sr)
         
         self._onset_envelope = onset_env
         return onset_env
@@ -4,17 +4,21 @@ Handles background effects, animations, and strobe effects.
 """
 
 import numpy as np
+from numba import njit
 from PIL import Image, ImageFilter, ImageEnhance
 from typing import Tuple, Optional
 
 
-def apply_blur(image: Image.Image, intensity: float) -> Image.Image:
+def apply_blur(image: Image.Image, intensity: float, fast: bool = False) -> Image.Image:
     """
     Apply Gaussian blur to an image.
     
     Args:
         image: PIL Image to blur
         intensity: Blur intensity (0.0 to 100.0)
+        fast: For large radii, blur a downscaled copy and scale it back up.
+            Much cheaper, within a few levels of the full blur; meant for
+            per-frame use such as video backgrounds.
         
     Returns:
         Blurred PIL Image
@@ -24,41 +28,143 @@ def apply_blur(image: Image.Image, intensity: float) -> Image.Image:
     
     # Convert intensity (0-100) to radius (0-20)
     radius = intensity / 5.0
+    
+    scale = int(radius // 4)
+    if fast and scale > 1:
+        small_size = (max(1, image.width // scale), max(1, image.height // scale))
+        small = image.resize(small_size, Image.BOX)
+        small = small.filter(ImageFilter.GaussianBlur(radius=radius / scale))
+        return small.resize(image.size, Image.BILINEAR)
+    
     return image.filter(ImageFilter.GaussianBlur(radius=radius))
 
 
-def apply_vignette(image: Image.Image, intensity: float) -> Image.Image:
+def apply_vignette(image: Image.Image, intensity: float,
+                   vignette_mask: Optional[np.ndarray] = None) -> Image.Image:
     """
     Apply vignette effect (darken edges) to an image.
     
     Args:
         image: PIL Image to apply vignette to
         intensity: Vignette intensity (0.0 to 100.0)
+        vignette_mask: Precomputed mask from build_vignette_mask (optional)
         
     Returns:
-        Image with vignette effect
+        Image with vignette effect (RGBA for RGBA input, RGB otherwise)
     """
     if intensity <= 0:
         return image
+    if vignette_mask is None:
+        vignette_mask = build_vignette_mask(image.width, image.height, intensity)
+    result = apply_background_effects(image, vignette_intensity=intensity, vignette_mask=vignette_mask)
+    
+    if image.mode == 'RGBA':
+        # The vignette fades the alpha channel like the color channels
+        alpha = np.asarray(image.getchannel('A')).astype(np.uint32)
+        alpha = ((alpha * vignette_mask) >> 15).astype(np.uint8)
+        result.putalpha(Image.fromarray(alpha, 'L'))
+    return result
+
+
+def build_vignette_mask(width: int, height: int, intensity: float) -> np.ndarray:
+    """
+    Build the vignette brightness mask.
     
-    width, height = image.size
+    Factors are stored as 1.15 fixed point (32768 = 1.0) so applying the
+    mask is integer-only and reads 2 bytes per pixel.
+    
+    Args:
+        width: Image width
+        height: Image height
+        intensity: Vignette intensity (0.0 to 100.0)
+        
+    Returns:
+        uint16 array of shape (height, width) with brightness factors
+        (0 to 32768)
+    """
     center_x, center_y = width / 2, height / 2
     max_distance = np.sqrt(center_x**2 + center_y**2)
     
-    # Convert image to numpy array
-    img_array = np.array(image, dtype=np.float32)
-    
-    # Create vignette mask
     y, x = np.ogrid[:height, :width]
     distance = np.sqrt((x - center_x)**2 + (y - center_y)**2)
     mask = 1.0 - (distance / max_distance) * (intensity / 100.0)
-    mask = np.clip(mask, 0.0, 1.0)
+    return np.rint(np.clip(mask, 0.0, 1.0) * 32768).astype(np.uint16)
+
+
+@njit(cache=True)
+def _bw_vignette_kernel(rgb_in: np.ndarray, rgb_out: np.ndarray, do_bw: bool,
+                        vignette_mask: np.ndarray) -> None:
+    """
+    Apply black and white and vignette in a single pass over the pixels.
     
-    # Apply vignette (darken edges)
-    for c in range(img_array.shape[2]):
-        img_array[:, :, c] *= mask
+    Black and white uses PIL's RGB to L weights, like apply_bw.
     
-    return Image.fromarray(np.clip(img_array, 0, 255).astype(np.uint8))
+    Args:
+        rgb_in: Input pixels, shape (height, width, 3), uint8
+        rgb_out: Output pixels, same shape as rgb_in
+        do_bw: Convert to black and white
+        vignette_mask: Fixed-point brightness factors of shape
+            (height, width) from build_vignette_mask, or an empty array for
+            no vignette
+    """
+    height, width = rgb_in.shape[0], rgb_in.shape[1]
+    do_vignette = vignette_mask.size > 0
+    for y in range(height):
+        for x in range(width):
+            r = np.int64(rgb_in[y, x, 0])
+            g = np.int64(rgb_in[y, x, 1])
+            b = np.int64(rgb_in[y, x, 2])
+            if do_bw:
+                r = (r * 19595 + g * 38470 + b * 7471 + 0x8000) >> 16
+                g = r
+                b = r
+            if do_vignette:
+                factor = np.int64(vignette_mask[y, x])
+                r = (r * factor) >> 15
+                g = (g * factor) >> 15
+                b = (b * factor) >> 15
+            rgb_out[y, x, 0] = r
+            rgb_out[y, x, 1] = g
+            rgb_out[y, x, 2] = b
+
+
+def apply_background_effects(image: Image.Image, bw: bool = False, blur_intensity: float = 0,
+                             vignette_intensity: float = 0,
+                             vignette_mask: Optional[np.ndarray] = None,
+                             fast_blur: bool = False) -> Image.Image:
+    """
+    Apply the background effect stack: blur, black and white, vignette.
+    
+    Black and white and vignette are fused into one pass over the pixels
+    after the blur.
+    
+    Args:
+        image: PIL Image (RGB)
+        bw: Convert to black and white
+        blur_intensity: Blur intensity (0.0 to 100.0)
+        vignette_intensity: Vignette intensity (0.0 to 100.0)
+        vignette_mask: Precomputed mask from build_vignette_mask (optional)
+        fast_blur: Use the downscaled blur (see apply_blur)
+        
+    Returns:
+        Processed RGB image
+    """
+    if blur_intensity > 0:
+        image = apply_blur(image, blur_intensity, fast=fast_blur)
+    
+    if not bw and vignette_intensity <= 0:
+        return image
+    
+    pixels = np.asarray(image.convert('RGB'))
+    if vignette_intensity > 0:
+        if vignette_mask is None:
+            vignette_mask = build_vignette_mask(image.width, image.height, vignette_intensity)
+    else:
+        vignette_mask = np.empty((0, 0), dtype=np.uint16)
+    
+    result = np.empty_like(pixels)
+    _bw_vignette_kernel(pixels, result, bw, vignette_mask)
+    return Image.fromarray(result, 'RGB')
 
 
 def apply_bw(image: Image.Image) -> Image.Image:
@@ -122,6 +228,32 @@ def fit_background(image: Image.Image, canvas_size: Tuple[int, int], mode: str)
         return image.resize((canvas_width, canvas_height), Image.Resampling.LANCZOS)
 
 
+def blend_color(frame: Image.Image, color: Tuple[int, int, int], alpha: float) -> Image.Image:
+    """
+    Blend a frame towards a solid color.
+    
+    Same result as Image.blend with a solid overlay, but done as a single
+    lookup table pass instead of allocating a full-frame overlay.
+    
+    Args:
+        frame: PIL Image to blend (RGB)
+        color: RGB color to blend towards
+        alpha: Blend factor (0.0 = frame, 1.0 = color)
+        
+    Returns:
+        Blended PIL Image
+    """
+    if frame.mode != 'RGB':
+        return Image.blend(frame, Image.new(frame.mode, frame.size, color=color), alpha)
+    
+    # Per-channel table using PIL's float32 blend arithmetic
+    values = np.arange(256, dtype=np.float32)
+    target = np.asarray(color[:3], dtype=np.float32)[:, None]
+    table = values + np.float32(alpha) * (target - values)
+    table = np.clip(table, 0, 255).astype(np.uint8)
+    return frame.point(table.ravel().tolist())
+
+
 def apply_strobe(frame: Image.Image, spectrum_data: np.ndarray, color: Tuple[int, int, int], 
                  threshold: float = 0.5, intensity: float = 0.8) -> Image.Image:
     """
@@ -145,12 +277,7 @@ def apply_strobe(frame: Image.Image, spectrum_data: np.ndarray, color: Tuple[int
     if normalized_intensity < threshold:
         return frame
     
-    # Create strobe overlay
-    overlay = Image.new('RGB', frame.size, color=color)
-    
-    # Blend with original frame
-    strobe_frame = Image.blend(frame, overlay, intensity)
-    return strobe_frame
+    return blend_color(frame, color, intensity)
 
 
 def fade_in(frame_number: int, total_frames: int) -> float:
@@ -244,14 +371,16 @@ def apply_beat_pulse(frame: Image.Image, beat_strength: float,
     new_width = int(width * scale)
     new_height = int(height * scale)
     
-    scaled = frame.resize((new_width, new_height), Image.Resampling.LANCZOS)
-    
-    # Crop back to original size (centered)
+    # Crop back to original size (centered); resample only the source box
+    # that ends up visible instead of scaling the whole frame and cropping
     left = (new_width - width) // 2
     top = (new_height - height) // 2
-    cropped = scaled.crop((left, top, left + width, top + height))
+    scale_x = width / new_width
+    scale_y = height / new_height
+    box = (left * scale_x, top * scale_y,
+           (left + width) * scale_x, (top + height) * scale_y)
     
-    return cropped
+    return frame.resize((width, height), Image.Resampling.LANCZOS, box=box)
 
 
 def apply_beat_flash(frame: Image.Image, beat_strength: float, 
@@ -275,12 +404,7 @@ def apply_beat_flash(frame: Image.Image, beat_strength: float,
     # Calculate flash intensity
     intensity = beat_strength * max_intensity
     
-    # Create flash overlay
-    overlay = Image.new('RGB', frame.size, color=color)
-    
-    # Blend with original frame
-    flashed = Image.blend(frame, overlay, intensity)
-    return flashed
+    return blend_color(frame, color, intensity)
 
 
 def apply_beat_strobe(frame: Image.Image, beat_strength: float, 
@@ -301,15 +425,10 @@ def apply_beat_strobe(frame: Image.Image, beat_strength: float,
     if beat_strength < threshold:
         return frame
     
-    # Full intensity strobe on beat
-    overlay = Image.new('RGB', frame.size, color=color)
-    
     # Calculate intensity based on beat strength
     intensity = min(0.8, beat_strength)
     
-    # Blend with original frame
-    strobed = Image.blend(frame, overlay, intensity)
-    return strobed
+    return blend_color(frame, color, intensity)
 
 
 def apply_beat_zoom(frame: Image.Image, beat_strength: float,
@@ -44,6 +44,9 @@ class SettingsManager:
         'use_hardware_acceleration': True,
         'encoding_preset': 'ultrafast',  # ultrafast, fast, medium, slow
         'use_multiprocessing': True,
+        'worker_count': 0,  # 0 = one worker per CPU core
+        'use_pipe': True,  # Stream frames to ffmpeg instead of writing frame files
+        'nvenc_preset': 'p4',  # p1 (fastest) - p7 (best quality)
         'beat_sync_enabled': False,
         'video_background_path': '',
         'background_type': 'solid_color',
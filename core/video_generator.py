@@ -5,17 +5,27 @@ Handles frame generation, spectrum visualization, and video assembly.
 
 import os
 import numpy as np
-from PIL import Image, ImageDraw, ImageFont
-import ffmpeg
-from typing import Tuple, Optional, Dict, Any, List
+import cv2
+from PIL import Image, ImageDraw, ImageFilter, ImageFont
+from typing import Tuple, Optional, Dict, Any, List, Callable
 import tempfile
 import shutil
-from multiprocessing import Pool, cpu_count
+import subprocess
+import threading
+import copy
+import pickle
+import uuid
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import cpu_count, get_context
+from multiprocessing.shared_memory import SharedMemory
 import time
+import platform
+from functools import lru_cache, partial
 
 from core.audio_processor import AudioProcessor
 from core.effects import (
-    apply_blur, apply_vignette, apply_bw, fit_background,
+    apply_background_effects, build_vignette_mask, fit_background,
     apply_strobe, apply_background_animation,
     apply_beat_pulse, apply_beat_flash, apply_beat_strobe, apply_beat_zoom,
     apply_fade_transition, apply_crossfade_transition, apply_slide_transition,
@@ -23,10 +33,283 @@ from core.effects import (
 )
 from core.video_background import VideoBackground
 from core.visualizers import VisualizerFactory
+from core.visualizers_numba import build_band_colors, draw_bars, blend_rgba_over_rgb
 from core.overlay_effects import OverlayFactory
 from core.logger import get_logger
 
 
+# Renderer of the frame worker running on this thread (see _get_worker_generator)
+_worker_local = threading.local()
+# Generators rendering in this process, by render token; thread pool
+# workers copy these instead of unpickling
+_local_generators: Dict[str, 'VideoGenerator'] = {}
+
+
+def create_frame_pool(workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """
+    Create a process pool for rendering frames that can be reused across videos.
+    
+    Pass it as the executor of generate_frames or generate_video so worker
+    processes start once rather than for every video, and shut it down when
+    done. Workers are spawned, not forked: the parent runs other threads
+    (GUI, ffmpeg readers) whose locks fork would copy mid-use.
+    
+    Args:
+        workers: Number of worker processes (None for one per CPU core)
+        
+    Returns:
+        Process pool for frame rendering
+    """
+    return ProcessPoolExecutor(max_workers=workers or cpu_count(), mp_context=get_context('spawn'))
+
+
+def _get_worker_generator(token: str, payload_name: str) -> 'VideoGenerator':
+    """
+    Get the calling worker's renderer for a render.
+    
+    Each worker keeps the renderer of the last render it worked on, so the
+    generator is loaded once per worker and render rather than per batch.
+    Thread pool workers copy the generator from this process; process pool
+    workers unpickle it from a shared memory block.
+    
+    Args:
+        token: Token identifying the render
+        payload_name: Name of the shared memory block holding the pickled generator
+        
+    Returns:
+        Generator to render with
+    """
+    if getattr(_worker_local, 'token', None) != token:
+        source = _local_generators.get(token)
+        if source is not None:
+            generator = copy.copy(source)
+        else:
+            payload = SharedMemory(name=payload_name)
+            try:
+                generator = pickle.loads(payload.buf)
+            finally:
+                payload.close()
+        _worker_local.generator = generator
+        _worker_local.token = token
+    return _worker_local.generator
+
+
+def _render_frame_batch(token: str, payload_name: str, frame_numbers: List[int],
+                        output_dir: Optional[str], shm_name: Optional[str] = None,
+                        shm_offset: int = 0) -> Tuple[int, int]:
+    """
+    Render a batch of frames in a worker.
+    
+    Frames either go to files in output_dir, or as raw RGB data into a
+    shared memory slot, so no pixel data has to be pickled back.
+    
+    Args:
+        token: Token identifying the render (see _get_worker_generator)
+        payload_name: Name of the shared memory block holding the pickled generator
+        frame_numbers: Frame numbers to render
+        output_dir: Directory to save frames (unused with shm_name)
+        shm_name: Name of the shared memory block receiving raw RGB frames
+        shm_offset: Byte offset of this batch's slot in the shared memory
+        
+    Returns:
+        Tuple of (frames generated, frames reused)
+    """
+    generator = _get_worker_generator(token, payload_name)
+    
+    reused_before = generator.frames_reused
+    shm = SharedMemory(name=shm_name) if shm_name else None
+    try:
+        offset = shm_offset
+        for frame_num in frame_numbers:
+            frame = generator.generate_frame(frame_num)
+            if shm is not None:
+                raw = generator._frame_to_raw(frame)
+                shm.buf[offset:offset + len(raw)] = raw
+                offset += len(raw)
+            else:
+                generator._save_frame(frame, output_dir, frame_num)
+    finally:
+        if shm is not None:
+            shm.close()
+    
+    return len(frame_numbers), generator.frames_reused - reused_before
+
+
+# Hardware H.264 encoders in order of preference
+HARDWARE_ENCODERS = ['h264_videotoolbox', 'h264_nvenc', 'h264_qsv', 'h264_amf']
+
+
+@lru_cache(maxsize=None)
+def _list_encoders() -> frozenset:
+    """
+    Get the names of the encoders compiled into ffmpeg.
+    
+    Returns:
+        Set of encoder names (empty if ffmpeg could not be run)
+    """
+    try:
+        result = subprocess.run(['ffmpeg', '-hide_banner', '-encoders'],
+                                capture_output=True, text=True, timeout=15)
+    except (OSError, subprocess.TimeoutExpired):
+        return frozenset()
+    
+    names = set()
+    for line in result.stdout.splitlines():
+        parts = line.split()
+        # Encoder lines look like " V....D libx264  description"
+        if len(parts) >= 2 and len(parts[0]) == 6 and parts[0][0] in 'VAS':
+            names.add(parts[1])
+    return frozenset(names)
+
+
+@lru_cache(maxsize=None)
+def _encoder_works(vcodec: str) -> bool:
+    """
+    Check that ffmpeg can actually encode with a video encoder.
+    
+    Hardware encoders can be compiled in without a device to run on, so
+    this encodes a single test frame rather than trusting the encoder list.
+    
+    Args:
+        vcodec: ffmpeg encoder name
+        
+    Returns:
+        True if the test encode succeeded
+    """
+    if vcodec not in _list_encoders():
+        return False
+    argv = ['ffmpeg', '-hide_banner', '-loglevel', 'error',
+            '-f', 'lavfi', '-i', 'color=size=256x256:rate=1:duration=1',
+            '-frames:v', '1', '-c:v', vcodec, '-pix_fmt', 'nv12', '-f', 'null', '-']
+    try:
+        result = subprocess.run(argv, stdout=subprocess.DEVNULL,
+                                stderr=subprocess.DEVNULL, timeout=15)
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+    return result.returncode == 0
+
+
+@lru_cache(maxsize=None)
+def _probe_audio_codec(audio_path: str, mtime: float) -> Optional[str]:
+    """
+    Get the codec of the first audio stream in a file.
+    
+    Args:
+        audio_path: Path to the audio file
+        mtime: Modification time of the file, so edits invalidate the cache
+        
+    Returns:
+        ffmpeg codec name (e.g. 'aac', 'mp3'), or None if it could not be read
+    """
+    try:
+        # Without an output ffmpeg just prints the input streams and exits
+        result = subprocess.run(['ffmpeg', '-hide_banner', '-i', audio_path],
+                                capture_output=True, text=True, timeout=15)
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    
+    for line in result.stderr.splitlines():
+        # e.g. "  Stream #0:0[0x1](und): Audio: aac (LC) (mp4a / 0x6134706D), ..."
+        if 'Stream #' in line and 'Audio: ' in line:
+            codec = line.split('Audio: ', 1)[1].split()[0].rstrip(',')
+            return codec or None
+    return None
+
+
+class FFmpegProcess:
+    """Runs an ffmpeg command and follows its progress output."""
+    
+    def __init__(self, argv: List[str], progress_callback: Optional[Callable[[int], None]] = None,
+                 log_lines: int = 20, pipe_stdin: bool = False):
+        """
+        Initialize ffmpeg process wrapper.
+        
+        Args:
+            argv: ffmpeg arguments (without the executable)
+            progress_callback: Callback function(frames_encoded)
+            log_lines: Number of trailing stderr lines kept for error reporting
+            pipe_stdin: Open stdin for writing input data (see write())
+        """
+        self.argv = ['ffmpeg', '-hide_banner', '-loglevel', 'error',
+                     '-nostats', '-progress', 'pipe:2', *argv]
+        self.progress_callback = progress_callback
+        self.pipe_stdin = pipe_stdin
+        self.log_tail = deque(maxlen=log_lines)
+        self.process = None
+        self._reader = None
+    
+    def start(self) -> None:
+        """Start ffmpeg and the stderr reader thread."""
+        self.process = subprocess.Popen(
+            self.argv,
+            stdin=subprocess.PIPE if self.pipe_stdin else subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE
+        )
+        self._reader = threading.Thread(target=self._read_stderr, daemon=True)
+        self._reader.start()
+    
+    def _read_stderr(self) -> None:
+        """Parse '-progress' key=value lines and keep other output for logging."""
+        for raw_line in self.process.stderr:
+            line = raw_line.decode('utf-8', errors='replace').strip()
+            if not line:
+                continue
+            key, sep, value = line.partition('=')
+            if sep and key == 'frame':
+                if self.progress_callback and value.isdigit():
+                    self.progress_callback(int(value))
+            elif sep and key in ('fps', 'stream_0_0_q', 'bitrate', 'total_size', 'out_time_us',
+                                 'out_time_ms', 'out_time', 'dup_frames', 'drop_frames',
+                                 'speed', 'progress'):
+                continue
+            else:
+                self.log_tail.append(line)
+    
+    def write(self, data: bytes) -> None:
+        """
+        Write input data to ffmpeg's stdin.
+        
+        Args:
+            data: Raw bytes, e.g. one or more rawvideo frames
+            
+        Raises:
+            BrokenPipeError: If ffmpeg has exited
+        """
+        self.process.stdin.write(data)
+    
+    def wait(self) -> bool:
+        """
+        Close stdin (if piped) and wait for ffmpeg to finish.
+        
+        Returns:
+            True if ffmpeg exited successfully, False otherwise
+        """
+        if self.process.stdin:
+            try:
+                self.process.stdin.close()
+            except OSError:
+                pass
+        returncode = self.process.wait()
+        self._reader.join()
+        if returncode != 0:
+            logger = get_logger()
+            logger.error(f"ffmpeg exited with code {returncode}")
+            for line in self.log_tail:
+                logger.error(f"ffmpeg: {line}")
+        return returncode == 0
+    
+    def run(self) -> bool:
+        """
+        Run ffmpeg to completion.
+        
+        Returns:
+            True if ffmpeg exited successfully, False otherwise
+        """
+        self.start()
+        return self.wait()
+
+
 class BackgroundManager:
     """Manages multiple backgrounds with slideshow and transitions."""
     
@@ -52,7 +335,8 @@ class BackgroundManager:
             self.background_paths = self.video_background_paths
         
         self.current_background_index = 0
-        self.cached_backgrounds = {}
+        # Decoded, effect-processed backgrounds (read-only RGB arrays)
+        self.cached_backgrounds: Dict[str, np.ndarray] = {}
         self.slideshow_enabled = settings.get('slideshow_enabled', False)
         self.slideshow_interval = settings.get('slideshow_interval', 10)  # seconds
         self.transition_duration = settings.get('transition_duration', 1.0)  # seconds
@@ -102,7 +386,7 @@ class BackgroundManager:
             # Create default black background
             return Image.new('RGB', (self.width, self.height), (0, 0, 0))
         
-        return self._load_and_process_background(bg_path)
+        return self._get_cached_background(bg_path)
     
     def _load_background_by_index(self, index: int) -> Image.Image:
         """
@@ -119,18 +403,34 @@ class BackgroundManager:
         
         bg_path = self.background_paths[index]
         
-        # Check cache
-        if bg_path in self.cached_backgrounds:
-            return self.cached_backgrounds[bg_path].copy()
-        
-        # Load and cache
-        bg = self._load_and_process_background(bg_path)
-        
         # Cache if reasonable number of backgrounds
         if len(self.background_paths) <= 10:
-            self.cached_backgrounds[bg_path] = bg.copy()
+            return self._get_cached_background(bg_path)
         
-        return bg
+        return self._load_and_process_background(bg_path)
+    
+    def _get_cached_background(self, bg_path: str) -> Image.Image:
+        """
+        Get a processed background from the cache, loading it on first use.
+        
+        The returned image shares memory with the cached array and is
+        read-only; callers that modify it in place must copy it first.
+        
+        Args:
+            bg_path: Path to background image
+            
+        Returns:
+            PIL Image backed by the cached array
+        """
+        bg_array = self.cached_backgrounds.get(bg_path)
+        if bg_array is None:
+            bg = self._load_and_process_background(bg_path)
+            bg_array = np.ascontiguousarray(np.asarray(bg, dtype=np.uint8))
+            bg_array.flags.writeable = False
+            self.cached_backgrounds[bg_path] = bg_array
+        
+        height, width = bg_array.shape[:2]
+        return Image.frombuffer('RGB', (width, height), bg_array, 'raw', 'RGB', 0, 1)
     
     def _load_and_process_background(self, bg_path: str) -> Image.Image:
         """
@@ -148,18 +448,12 @@ class BackgroundManager:
             bg = fit_background(bg, (self.width, self.height), fit_mode)
             
             # Apply effects
-            if self.settings.get('background_bw', False):
-                bg = apply_bw(bg)
-            
-            blur_intensity = self.settings.get('background_blur', 0)
-            if blur_intensity > 0:
-                bg = apply_blur(bg, blur_intensity)
-            
-            vignette_intensity = self.settings.get('vignette_intensity', 0)
-            if vignette_intensity > 0:
-                bg = apply_vignette(bg, vignette_intensity)
-            
-            return bg
+            return apply_background_effects(
+                bg,
+                bw=self.settings.get('background_bw', False),
+                blur_intensity=self.settings.get('background_blur', 0),
+                vignette_intensity=self.settings.get('vignette_intensity', 0)
+            )
         except Exception as e:
             logger = get_logger()
             logger.error(f"Error loading background {bg_path}: {e}", exc_info=True)
@@ -201,11 +495,35 @@ class VideoGenerator:
             settings: Settings dictionary
         """
         self.audio_processor = audio_processor
+        self.temp_dir = None
+        self.video_background = None
+        self.frames_reused = 0
+        self.update_settings(settings)
+        self._warm_up_kernels()
+    
+    @staticmethod
+    def _warm_up_kernels() -> None:
+        """Compile the per-frame Numba kernels now rather than on the first frame."""
+        # Layers are read-only arrays of cropped images; the frame region is
+        # either the whole (contiguous) frame or a strided slice of it
+        frame = np.zeros((2, 2, 3), dtype=np.uint8)
+        blend_rgba_over_rgb(frame, np.asarray(Image.new('RGBA', (2, 2))))
+        blend_rgba_over_rgb(frame[:, :1], np.asarray(Image.new('RGBA', (1, 2))))
+    
+    def update_settings(self, settings: Dict[str, Any]) -> None:
+        """
+        Apply new settings, rebuilding everything derived from them.
+        
+        Args:
+            settings: Settings dictionary
+        """
+        if self.video_background:
+            self.video_background.close()
+        
         self.settings = settings
         self.width = settings.get('video_width', 1920)
         self.height = settings.get('video_height', 1080)
         self.frame_rate = settings.get('frame_rate', 30)
-        self.temp_dir = None
         self.video_background = None
         self._init_video_background()
         self.visualizer = None
@@ -214,13 +532,213 @@ class VideoGenerator:
         self._init_overlay_effect()
         self.background_manager = BackgroundManager(settings, self.frame_rate, self.width, self.height)
         # Caching
-        self._cached_logo = None
-        self._cached_logo_path = None
+        self._logo_image = None
+        self._logo_position = (0, 0)
+        self._init_logo()
+        # Per-thread drawing buffers: frames may be rendered by several
+        # threads sharing this generator
+        self._render_local = threading.local()
+        self._band_colors = build_band_colors(64)
+        # Reusable RGBA scratch layers are kept per thread in _render_local
+        self._vignette_mask_cache: Dict[Tuple[int, int, float], np.ndarray] = {}
+        # Fonts by size and pre-rendered static text
+        self._font_cache: Dict[int, ImageFont.ImageFont] = {}
+        self._text_sprite_cache: Dict[Tuple, Tuple[Optional[Image.Image], Tuple[int, int]]] = {}
+        # Last visualizer layer, reused while the bands repeat (kept per
+        # thread in _render_local as a (key, layer) pair)
+        self._spectrum_layer_cacheable = not self._has_stateful_visualizer()
+        # Frame de-duplication for idle segments: (frame key, frame), assigned
+        # as one tuple so threads sharing the generator never mix the two
+        self._dedup_enabled = self._is_dedup_eligible()
+        self._last_frame = (None, None)
+        self._total_frames = None
+        self._cache_settings()
+        # Per-frame audio features for the whole track
+        self._bands_arr: Optional[np.ndarray] = None
+        self._spectrum_arr: Optional[np.ndarray] = None
+        self._beats_arr: Optional[np.ndarray] = None
+    
+    def _cache_settings(self) -> None:
+        """Snapshot the settings read for every frame into instance attributes."""
+        settings = self.settings
+        white = [255, 255, 255]
+        
+        # Background
+        self._beat_shake_intensity = settings.get('background_beat_shake_intensity', 50)
+        self._beat_shake_enabled = (settings.get('background_beat_shake_enabled', False)
+                                    and self._beat_shake_intensity > 0)
+        self._background_animation = settings.get('background_animation', 'none') or 'none'
+        self._background_opacity = settings.get('background_opacity', 100)
+        self._background_bw = settings.get('background_bw', False)
+        self._background_blur = settings.get('background_blur', 0)
+        self._vignette_intensity = settings.get('vignette_intensity', 0)
+        
+        # Visualizer and overlay
+        self._visualizer_enabled = settings.get('visualizer_enabled', True)
+        self._visualizer_opacity = settings.get('visualizer_opacity', 100)
+        self._overlay_opacity = settings.get('overlay_opacity', 100)
+        
+        # Beat and strobe effects
+        self._beat_sync = settings.get('beat_sync_enabled', False)
+        self._beat_effect_type = settings.get('beat_effect_type', 'pulse')
+        self._beat_flash_color = tuple(settings.get('beat_flash_color', white))
+        self._beat_strobe_color = tuple(settings.get('beat_strobe_color', white))
+        self._strobe_enabled = settings.get('strobe_enabled', False)
+        self._strobe_color = tuple(settings.get('strobe_color', white))
+        self._beat_effect = self._select_beat_effect() if self._beat_sync else None
+        
+        # Text and logo
+        self._text_overlay = settings.get('text_overlay', '')
+        self._text_color = tuple(settings.get('text_color', white))
+        self._text_position = settings.get('text_position', 'center')
+        self._text_opacity = settings.get('text_opacity', 100)
+        self._logo_path = settings.get('logo_path', '')
+        self._logo_text = settings.get('logo_text', '')
+        self._logo_opacity = settings.get('logo_opacity', 100)
+
+    def _select_beat_effect(self) -> Optional[Callable[[Image.Image, float], Image.Image]]:
+        """
+        Resolve the beat effect setting to a function, once per render.
+        
+        Returns:
+            Function(frame, beat_strength) applying the effect, or None for
+            an unknown effect type
+        """
+        beat_effect_type = self._beat_effect_type
+        if beat_effect_type == 'pulse':
+            return apply_beat_pulse
+        elif beat_effect_type == 'flash':
+            return partial(apply_beat_flash, color=self._beat_flash_color)
+        elif beat_effect_type == 'strobe':
+            return partial(apply_beat_strobe, color=self._beat_strobe_color)
+        elif beat_effect_type == 'zoom':
+            return apply_beat_zoom
+        return None
+    
+    def __reduce__(self):
+        """
+        Pickle as settings plus audio analysis; the renderer state is rebuilt.
+        
+        This keeps video captures, visualizer instances and scratch buffers
+        out of worker processes, and copy.copy() yields an independent
+        renderer that shares the audio processor.
+        """
+        return (self.__class__, (self.audio_processor, self.settings))
+    
+    def _has_stateful_layers(self) -> bool:
+        """
+        Check whether frames depend on previously rendered frames.
+        
+        Overlay particles and particle/ring visualizers advance their state
+        every frame, so they must be rendered in order by a single renderer.
+        
+        Returns:
+            True if frames must be rendered sequentially
+        """
+        if self.overlay_effect is not None:
+            return True
+        return self.settings.get('visualizer_enabled', True) and self._has_stateful_visualizer()
+    
+    def _has_stateful_visualizer(self) -> bool:
+        """
+        Check whether the visualizer layer depends on previously rendered frames.
+        
+        Returns:
+            True if the configured visualizer style keeps state between frames
+        """
+        # Particle and ring visualizers keep animating during silence
+        stateful_styles = ('particle', 'waveform_particle', 'pulse_ring')
+        visualizer_style = self.settings.get('visualizer_style', 'bars').lower().replace(' ', '_')
+        return visualizer_style in stateful_styles
     
-    def _create_temp_dir(self) -> str:
-        """Create temporary directory for frames."""
+    def _is_dedup_eligible(self) -> bool:
+        """
+        Check whether identical inputs always produce identical frames.
+
+        Frames can only be reused when nothing else in the pipeline changes
+        over time: a still background, no background animation, no overlay
+        particles and a stateless visualizer.
+
+        Returns:
+            True if frame de-duplication can be used
+        """
+        if self.video_background is not None:
+            return False
+        if self.settings.get('slideshow_enabled', False) and self.background_manager.background_paths:
+            return False
+        if self.settings.get('background_animation', 'none') != 'none':
+            return False
+        return not self._has_stateful_layers()
+
+    def _get_frame_key(self, bands: np.ndarray, spectrum_data: np.ndarray,
+                       beat_strength: float) -> Optional[bytes]:
+        """
+        Build a key identifying the rendered content of a frame.
+
+        Args:
+            bands: Frequency band magnitudes
+            spectrum_data: Full spectrum data
+            beat_strength: Beat strength for the frame
+
+        Returns:
+            Key bytes, or None if the frame must be rendered
+        """
+        if not self._dedup_enabled:
+            return None
+
+        # Beat-driven effects change the frame while a beat is active
+        if beat_strength >= 0.01:
+            return None
+
+        key = bands.tobytes()
+        if self._strobe_enabled:
+            key += b'\x01' if np.mean(spectrum_data) / 0.1 >= 0.5 else b'\x00'
+        return key
+
+    def _precompute_audio_features(self) -> None:
+        """
+        Compute band, spectrum and beat arrays for all frames once.
+        
+        generate_frame then only indexes these arrays.
+        """
+        if self._bands_arr is not None:
+            return
+        
+        self._spectrum_arr = self.audio_processor.compute_spectrum(frame_rate=self.frame_rate)
+        self._bands_arr = self.audio_processor.get_frequency_bands(num_bands=64, frame_rate=self.frame_rate)
+        if self._beat_shake_enabled or self._beat_sync:
+            self._beats_arr = self.audio_processor.get_beat_strengths(
+                self._bands_arr.shape[0], self.frame_rate
+            )
+    
+    def _get_total_frames(self) -> int:
+        """Get the total number of frames for the full audio (computed once)."""
+        if self._total_frames is None:
+            self._total_frames = int(self.audio_processor.get_duration() * self.frame_rate)
+        return self._total_frames
+    
+    def _create_temp_dir(self, required_bytes: int = 0) -> str:
+        """
+        Create temporary directory for frames.
+        
+        The directory goes on the RAM-backed /dev/shm when it exists and has
+        room for twice the frames, otherwise in the system temp directory.
+        
+        Args:
+            required_bytes: Expected total size of the frame files
+            
+        Returns:
+            Path to the temporary directory
+        """
         if self.temp_dir is None:
-            self.temp_dir = tempfile.mkdtemp(prefix='spectrum_viz_')
+            parent = None
+            if required_bytes and os.path.isdir('/dev/shm'):
+                try:
+                    if shutil.disk_usage('/dev/shm').free > 2 * required_bytes:
+                        parent = '/dev/shm'
+                except OSError:
+                    pass
+            self.temp_dir = tempfile.mkdtemp(prefix='spectrum_viz_', dir=parent)
         return self.temp_dir
     
     def _cleanup_temp_dir(self) -> None:
@@ -253,6 +771,39 @@ class VideoGenerator:
             visualizer_style, self.width, self.height, self.settings
         )
     
+    def _init_logo(self) -> None:
+        """Load, scale and position the image logo once for the whole video."""
+        logo_path = self.settings.get('logo_path', '')
+        if self.settings.get('logo_text', '') or not logo_path or not os.path.exists(logo_path):
+            return
+        
+        try:
+            logo = Image.open(logo_path).convert('RGBA')
+            
+            # Get logo size setting (5-20% of height)
+            logo_scale = self.settings.get('logo_scale', 10) / 100
+            logo_size = int(self.height * logo_scale)
+            if logo.width > logo_size or logo.height > logo_size:
+                # Area filter on premultiplied alpha, like PIL's RGBA resize
+                scale = min(logo_size / logo.width, logo_size / logo.height)
+                new_size = (max(1, round(logo.width * scale)), max(1, round(logo.height * scale)))
+                arr = cv2.resize(np.asarray(logo.convert('RGBa')), new_size,
+                                 interpolation=cv2.INTER_AREA)
+                logo = Image.frombuffer('RGBa', new_size, arr.tobytes()).convert('RGBA')
+            
+            # Apply logo opacity
+            logo_opacity = self.settings.get('logo_opacity', 100)
+            if logo_opacity < 100:
+                logo = self._apply_opacity(logo, logo_opacity)
+            
+            position = self.settings.get('logo_position', 'top-right')
+            self._logo_position = self._calculate_logo_position(logo.width, logo.height, position)
+            self._logo_image = logo
+        except Exception as e:
+            logger = get_logger()
+            logger.error(f"Error loading logo: {e}", exc_info=True)
+            self._logo_image = None
+    
     def _init_overlay_effect(self) -> None:
         """Initialize overlay effect based on settings."""
         overlay_type = self.settings.get('overlay_effect_type', 'none')
@@ -260,6 +811,107 @@ class VideoGenerator:
             overlay_type, self.width, self.height, self.settings
         )
     
+    def _get_scratch_layer(self, name: str) -> Image.Image:
+        """
+        Get a cleared, full-frame RGBA layer that is reused across frames.
+        
+        The layer draws straight into a numpy buffer, so no image memory is
+        allocated per frame. Each rendering thread has its own layers; the
+        contents are only valid until the same thread requests the same
+        layer again.
+        
+        Args:
+            name: Layer name ('text', 'logo_text', 'composite', ...)
+            
+        Returns:
+            Transparent RGBA image backed by the named buffer
+        """
+        scratch = getattr(self._render_local, 'scratch', None)
+        if scratch is None:
+            scratch = self._render_local.scratch = {}
+        
+        entry = scratch.get(name)
+        if entry is None:
+            buffer = np.zeros((self.height, self.width, 4), dtype=np.uint8)
+            layer = Image.frombuffer('RGBA', (self.width, self.height), buffer, 'raw', 'RGBA', 0, 1)
+            # frombuffer images are read-only; allow drawing into the buffer
+            layer.readonly = 0
+            scratch[name] = (buffer, layer)
+        else:
+            buffer, layer = entry
+            buffer.fill(0)
+        return layer
+    
+    def _to_composite_layer(self, image: Image.Image) -> Image.Image:
+        """
+        Copy an image into the reusable RGBA composite layer.
+        
+        Args:
+            image: RGB or RGBA frame
+            
+        Returns:
+            RGBA copy of the frame held in the composite scratch layer
+        """
+        if image.size != (self.width, self.height):
+            return image.convert('RGBA')
+        composite = self._get_scratch_layer('composite')
+        composite.paste(image, (0, 0))
+        return composite
+    
+    def _alpha_composite(self, image: Image.Image, layer: Image.Image,
+                         position: Tuple[int, int] = (0, 0)) -> Image.Image:
+        """
+        Composite an RGBA layer over a frame.
+        
+        Args:
+            image: Base frame
+            layer: RGBA layer to composite on top
+            position: Top-left position of the layer on the frame
+            
+        Returns:
+            New composited image (RGB for RGB frames, RGBA otherwise)
+        """
+        return self._composite_layers(image, [(layer, position)])
+    
+    def _composite_layers(self, image: Image.Image,
+                          layers: List[Tuple[Image.Image, Tuple[int, int]]]) -> Image.Image:
+        """
+        Composite RGBA layers over a frame, bottom to top.
+        
+        Opaque RGB frames are copied to NumPy once, every layer is blended
+        in place (limited to the visible part of its non-transparent
+        bounding box), and the frame stays RGB; other frames fall back to
+        PIL.
+        
+        Args:
+            image: Base frame
+            layers: (RGBA layer, top-left position) pairs in stacking order
+            
+        Returns:
+            New composited image (RGB for RGB frames, RGBA otherwise)
+        """
+        if image.mode != 'RGB' or any(layer.mode != 'RGBA' for layer, _ in layers):
+            for layer, position in layers:
+                if layer.size == image.size and position == (0, 0):
+                    image = Image.alpha_composite(self._to_composite_layer(image), layer)
+                else:
+                    image = image.convert('RGBA')
+                    image.alpha_composite(layer.convert('RGBA'), dest=position)
+            return image
+        
+        result = np.array(image)
+        for layer, (x, y) in layers:
+            bbox = layer.getbbox()
+            if bbox is None:
+                continue
+            left, top, right, bottom = bbox
+            x0, y0 = max(x + left, 0), max(y + top, 0)
+            x1, y1 = min(x + right, image.width), min(y + bottom, image.height)
+            if x0 < x1 and y0 < y1:
+                region = np.asarray(layer.crop((x0 - x, y0 - y, x1 - x, y1 - y)))
+                blend_rgba_over_rgb(result[y0:y1, x0:x1], region)
+        return Image.fromarray(result, 'RGB')
+    
     def _draw_spectrum_bars(self, bands: np.ndarray, width: int, height: int) -> Image.Image:
         """
         Draw spectrum bars visualization.
@@ -276,49 +928,65 @@ class VideoGenerator:
         bar_width = width // num_bands
         bar_spacing = 2
         
-        # Create image
-        spectrum_img = Image.new('RGBA', (width, height), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(spectrum_img)
+        # Reuse this thread's drawing buffer across frames
+        bars_buffer = getattr(self._render_local, 'bars_buffer', None)
+        if bars_buffer is None or bars_buffer.shape[:2] != (height, width):
+            bars_buffer = np.zeros((height, width, 4), dtype=np.uint8)
+            self._render_local.bars_buffer = bars_buffer
+        else:
+            bars_buffer.fill(0)
         
         # Normalize bands
-        if np.max(bands) > 0:
-            normalized_bands = bands / np.max(bands)
+        max_band = np.max(bands)
+        if max_band > 0:
+            normalized_bands = bands / max_band
         else:
             normalized_bands = bands
         
-        # Draw bars
-        for i, magnitude in enumerate(normalized_bands):
-            bar_height = int(magnitude * height * 0.8)  # Use 80% of height
-            x = i * bar_width + bar_spacing
-            
-            # Color gradient: low freq = red, mid = green, high = blue
-            if i < num_bands / 3:
-                # Low frequency - red to yellow
-                r = 255
-                g = int(255 * (i / (num_bands / 3)))
-                b = 0
-            elif i < num_bands * 2 / 3:
-                # Mid frequency - yellow to cyan
-                r = int(255 * (1 - (i - num_bands / 3) / (num_bands / 3)))
-                g = 255
-                b = int(255 * ((i - num_bands / 3) / (num_bands / 3)))
-            else:
-                # High frequency - cyan to blue
-                r = 0
-                g = int(255 * (1 - (i - num_bands * 2 / 3) / (num_bands / 3)))
-                b = 255
-            
-            color = (r, g, b, 255)
-            
-            # Draw bar from bottom
-            # Ensure bar_height doesn't exceed height and coordinates are valid
-            bar_height = min(bar_height, height)
-            y1 = max(0, height - bar_height)
-            y2 = height
-            # Ensure valid rectangle coordinates
-            if y1 < y2 and x < x + bar_width - bar_spacing:
-                draw.rectangle([x, y1, x + bar_width - bar_spacing, y2], fill=color)
+        band_colors = self._band_colors
+        if len(band_colors) != num_bands:
+            band_colors = self._band_colors = build_band_colors(num_bands)
         
+        draw_bars(bars_buffer, np.asarray(normalized_bands, dtype=np.float64),
+                  band_colors, bar_width, bar_spacing, height)
+        
+        return Image.fromarray(bars_buffer, 'RGBA')
+    
+    def _get_spectrum_layer(self, bands: np.ndarray, spectrum_data: np.ndarray,
+                            frame_number: int) -> Image.Image:
+        """
+        Render the visualizer layer with the visualizer opacity applied.
+        
+        Stateless visualizers draw the same layer for the same bands, so the
+        previous layer is reused while the bands repeat (silence, held notes).
+        
+        Args:
+            bands: Frequency band magnitudes
+            spectrum_data: Full spectrum data
+            frame_number: Frame number
+            
+        Returns:
+            RGBA visualizer layer
+        """
+        key = bands.tobytes() if self._spectrum_layer_cacheable else None
+        if key is not None:
+            cached_key, cached_layer = getattr(self._render_local, 'spectrum_layer', (None, None))
+            if key == cached_key:
+                return cached_layer
+        
+        # Use new visualizer system
+        if self.visualizer:
+            spectrum_img = self.visualizer.render(bands, spectrum_data, frame_number)
+        else:
+            # Fallback to old method
+            spectrum_img = self._draw_spectrum_bars(bands, self.width, self.height)
+        
+        # Apply visualizer opacity
+        if self._visualizer_opacity < 100:
+            spectrum_img = self._apply_opacity(spectrum_img, self._visualizer_opacity)
+        
+        if key is not None:
+            self._render_local.spectrum_layer = (key, spectrum_img)
         return spectrum_img
     
     def _load_background(self, frame_number: int = 0) -> Optional[Image.Image]:
@@ -340,18 +1008,15 @@ class VideoGenerator:
                 )
                 if bg:
                     # Apply effects to video frame
-                    if self.settings.get('background_bw', False):
-                        bg = apply_bw(bg)
-                    
-                    blur_intensity = self.settings.get('background_blur', 0)
-                    if blur_intensity > 0:
-                        bg = apply_blur(bg, blur_intensity)
-                    
-                    vignette_intensity = self.settings.get('vignette_intensity', 0)
-                    if vignette_intensity > 0:
-                        bg = apply_vignette(bg, vignette_intensity)
-                    
-                    return bg
+                    vignette_intensity = self._vignette_intensity
+                    return apply_background_effects(
+                        bg,
+                        bw=self._background_bw,
+                        blur_intensity=self._background_blur,
+                        vignette_intensity=vignette_intensity,
+                        vignette_mask=self._get_vignette_mask(bg.width, bg.height, vignette_intensity),
+                        fast_blur=True
+                    )
             except Exception as e:
                 logger = get_logger()
                 logger.error(f"Error loading video background frame: {e}", exc_info=True)
@@ -364,36 +1029,74 @@ class VideoGenerator:
         
         return bg
     
-    def _add_text_overlay(self, image: Image.Image, text: str, position: str = 'center',
-                         color: Tuple[int, int, int] = (255, 255, 255)) -> Image.Image:
+    def _get_vignette_mask(self, width: int, height: int, intensity: float) -> Optional[np.ndarray]:
+        """
+        Get the vignette mask for a frame size and intensity, building it once.
+        
+        Args:
+            width: Frame width
+            height: Frame height
+            intensity: Vignette intensity (0.0 to 100.0)
+            
+        Returns:
+            Vignette mask, or None if the vignette is off
+        """
+        if intensity <= 0:
+            return None
+        key = (width, height, intensity)
+        mask = self._vignette_mask_cache.get(key)
+        if mask is None:
+            mask = build_vignette_mask(width, height, intensity)
+            self._vignette_mask_cache[key] = mask
+        return mask
+    
+    def _get_text_overlay_sprite(self, text: str, position: str = 'center',
+                                 color: Tuple[int, int, int] = (255, 255, 255)
+                                 ) -> Optional[Tuple[Image.Image, Tuple[int, int]]]:
         """
-        Add text overlay to image.
+        Get the text overlay as a positioned sprite.
         
         Args:
-            image: Base image
             text: Text to add
             position: Position ('center', 'top', 'bottom', etc.)
             color: Text color (RGB)
             
         Returns:
-            Image with text overlay
+            Tuple of (RGBA sprite, position), or None if nothing is visible
         """
         if not text:
-            return image
+            return None
+        
+        # Static text is rendered once and reused as a sprite
+        key = ('text', text, position, tuple(color), self._text_opacity)
+        if key not in self._text_sprite_cache:
+            text_layer = self._render_text_overlay(text, position, color)
+            self._text_sprite_cache[key] = self._crop_to_sprite(text_layer)
+        
+        sprite, sprite_position = self._text_sprite_cache[key]
+        if sprite is None:
+            return None
+        return sprite, sprite_position
+    
+    def _render_text_overlay(self, text: str, position: str,
+                             color: Tuple[int, int, int]) -> Image.Image:
+        """
+        Render outlined overlay text into a full-frame layer.
         
-        # Create transparent layer for text
-        text_layer = Image.new('RGBA', (self.width, self.height), (0, 0, 0, 0))
+        Args:
+            text: Text to render
+            position: Position ('center', 'top', 'bottom', etc.)
+            color: Text color (RGB)
+            
+        Returns:
+            RGBA layer with the text (a scratch layer, valid until reused)
+        """
+        # Reuse transparent layer for text
+        text_layer = self._get_scratch_layer('text')
         draw = ImageDraw.Draw(text_layer)
         
         # Try to use a nice font, fallback to default
-        try:
-            font_size = min(self.height // 20, 72)
-            font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", font_size)
-        except:
-            try:
-                font = ImageFont.truetype("arial.ttf", min(self.height // 20, 72))
-            except:
-                font = ImageFont.load_default()
+        font = self._get_font(min(self.height // 20, 72))
         
         # Get text bounding box
         bbox = draw.textbbox((0, 0), text, font=font)
@@ -415,21 +1118,71 @@ class VideoGenerator:
             y = (self.height - text_height) // 2
         
         # Draw text with outline for visibility
-        outline_color = (0, 0, 0, 255)
-        for adj in [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]:
-            draw.text((x + adj[0], y + adj[1]), text, font=font, fill=outline_color)
-        draw.text((x, y), text, font=font, fill=(*color, 255))
+        self._draw_outlined_text(text_layer, (x, y), text, font, color)
         
         # Apply text opacity
-        text_opacity = self.settings.get('text_opacity', 100)
-        if text_opacity < 100:
-            text_layer = self._apply_opacity(text_layer, text_opacity)
+        if self._text_opacity < 100:
+            text_layer = self._apply_opacity(text_layer, self._text_opacity)
         
-        # Composite text onto image
-        image = image.convert('RGBA')
-        image = Image.alpha_composite(image, text_layer)
+        return text_layer
+    
+    def _draw_outlined_text(self, layer: Image.Image, xy: Tuple[int, int], text: str,
+                            font: ImageFont.ImageFont, color: Tuple[int, int, int]) -> None:
+        """
+        Draw text with a 1-pixel black outline.
         
-        return image
+        The outline is the text mask dilated by one pixel (3x3 max filter),
+        so the glyphs are rasterized twice instead of once per outline offset.
+        
+        Args:
+            layer: Transparent RGBA layer to draw on
+            xy: Text position
+            text: Text to draw
+            font: Font to use
+            color: Text color (RGB)
+        """
+        mask = Image.new('L', layer.size, 0)
+        ImageDraw.Draw(mask).text(xy, text, font=font, fill=255)
+        outline = mask.filter(ImageFilter.MaxFilter(3))
+        layer.paste((0, 0, 0, 255), (0, 0), outline)
+        ImageDraw.Draw(layer).text(xy, text, font=font, fill=(*color, 255))
+    
+    def _get_font(self, font_size: int) -> ImageFont.ImageFont:
+        """
+        Get a font of the given size, loading it once.
+        
+        Args:
+            font_size: Font size in pixels
+            
+        Returns:
+            Helvetica or Arial if available, otherwise PIL's default font
+        """
+        font = self._font_cache.get(font_size)
+        if font is None:
+            try:
+                font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", font_size)
+            except:
+                try:
+                    font = ImageFont.truetype("arial.ttf", font_size)
+                except:
+                    font = ImageFont.load_default()
+            self._font_cache[font_size] = font
+        return font
+    
+    def _crop_to_sprite(self, layer: Image.Image) -> Tuple[Optional[Image.Image], Tuple[int, int]]:
+        """
+        Crop a full-frame layer to its visible content.
+        
+        Args:
+            layer: RGBA layer
+            
+        Returns:
+            Tuple of (cropped RGBA sprite or None if empty, sprite position)
+        """
+        bbox = layer.getbbox()
+        if bbox is None:
+            return None, (0, 0)
+        return layer.crop(bbox), (bbox[0], bbox[1])
     
     def _apply_opacity(self, image: Image.Image, opacity: int) -> Image.Image:
         """
@@ -449,90 +1202,64 @@ class VideoGenerator:
         if image.mode != 'RGBA':
             image = image.convert('RGBA')
         
-        # Apply opacity
-        alpha = image.split()[3]
-        alpha = alpha.point(lambda p: int(p * opacity / 100))
-        image.putalpha(alpha)
+        # Scale alpha through a 256-entry lookup table
+        alpha_table = (np.arange(256) * opacity / 100).astype(np.uint8).tolist()
+        image.putalpha(image.getchannel('A').point(alpha_table))
         
         return image
     
-    def _add_logo(self, image: Image.Image, logo_path: str) -> Image.Image:
+    def _get_logo_sprite(self) -> Optional[Tuple[Image.Image, Tuple[int, int]]]:
         """
-        Add logo overlay to image.
+        Get the logo (image or text-as-logo) as a positioned sprite.
         
-        Args:
-            image: Base image
-            logo_path: Path to logo image
-            
         Returns:
-            Image with logo overlay
+            Tuple of (RGBA sprite, position), or None if there is no logo
         """
         # Check for text-as-logo
-        logo_text = self.settings.get('logo_text', '')
-        if logo_text:
-            return self._add_text_logo(image, logo_text)
+        if self._logo_text:
+            return self._get_text_logo_sprite(self._logo_text)
         
-        if not logo_path or not os.path.exists(logo_path):
-            return image
+        if self._logo_image is None:
+            return None
+        return self._logo_image, self._logo_position
+    
+    def _get_text_logo_sprite(self, text: str) -> Optional[Tuple[Image.Image, Tuple[int, int]]]:
+        """
+        Get text-as-logo as a positioned sprite.
         
-        try:
-            # Check cache
-            if self._cached_logo_path == logo_path and self._cached_logo is not None:
-                logo = self._cached_logo.copy()
-            else:
-                logo = Image.open(logo_path).convert('RGBA')
-                
-                # Get logo size setting (5-20% of height)
-                logo_scale = self.settings.get('logo_scale', 10) / 100
-                logo_size = int(self.height * logo_scale)
-                logo.thumbnail((logo_size, logo_size), Image.Resampling.LANCZOS)
-                
-                # Cache the logo
-                self._cached_logo = logo.copy()
-                self._cached_logo_path = logo_path
-            
-            # Apply logo opacity
-            logo_opacity = self.settings.get('logo_opacity', 100)
-            if logo_opacity < 100:
-                logo = self._apply_opacity(logo, logo_opacity)
-            
-            # Get logo position
-            position = self.settings.get('logo_position', 'top-right')
-            x, y = self._calculate_logo_position(logo.width, logo.height, position)
+        Args:
+            text: Text to render as logo
             
-            # Paste with alpha
-            image = image.convert('RGBA')
-            image.paste(logo, (x, y), logo)
-            return image
-        except Exception as e:
-            logger = get_logger()
-            logger.error(f"Error adding logo: {e}", exc_info=True)
-            return image
+        Returns:
+            Tuple of (RGBA sprite, position), or None if nothing is visible
+        """
+        # Static text is rendered once and reused as a sprite
+        key = ('logo_text', text, self._text_color, self._logo_opacity)
+        if key not in self._text_sprite_cache:
+            text_layer = self._render_text_logo(text)
+            self._text_sprite_cache[key] = self._crop_to_sprite(text_layer)
+        
+        sprite, sprite_position = self._text_sprite_cache[key]
+        if sprite is None:
+            return None
+        return sprite, sprite_position
     
-    def _add_text_logo(self, image: Image.Image, text: str) -> Image.Image:
+    def _render_text_logo(self, text: str) -> Image.Image:
         """
-        Add text as logo.
+        Render outlined logo text into a full-frame layer.
         
         Args:
-            image: Base image
             text: Text to render as logo
             
         Returns:
-            Image with text logo
+            RGBA layer with the text (a scratch layer, valid until reused)
         """
-        # Create text layer
-        text_layer = Image.new('RGBA', (self.width, self.height), (0, 0, 0, 0))
+        # Reuse text layer
+        text_layer = self._get_scratch_layer('logo_text')
         draw = ImageDraw.Draw(text_layer)
         
         # Load font
-        try:
-            font_size = int(self.height * 0.05)  # 5% of height
-            font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", font_size)
-        except:
-            try:
-                font = ImageFont.truetype("arial.ttf", int(self.height * 0.05))
-            except:
-                font = ImageFont.load_default()
+        font = self._get_font(int(self.height * 0.05))  # 5% of height
         
         # Get text size
         bbox = draw.textbbox((0, 0), text, font=font)
@@ -544,23 +1271,13 @@ class VideoGenerator:
         x, y = self._calculate_logo_position(text_width, text_height, position)
         
         # Draw text with outline
-        outline_color = (0, 0, 0, 255)
-        text_color = self.settings.get('text_color', [255, 255, 255])
-        
-        for adj in [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]:
-            draw.text((x + adj[0], y + adj[1]), text, font=font, fill=outline_color)
-        draw.text((x, y), text, font=font, fill=(*text_color, 255))
+        self._draw_outlined_text(text_layer, (x, y), text, font, self._text_color)
         
         # Apply opacity
-        logo_opacity = self.settings.get('logo_opacity', 100)
-        if logo_opacity < 100:
-            text_layer = self._apply_opacity(text_layer, logo_opacity)
-        
-        # Composite
-        image = image.convert('RGBA')
-        image = Image.alpha_composite(image, text_layer)
+        if self._logo_opacity < 100:
+            text_layer = self._apply_opacity(text_layer, self._logo_opacity)
         
-        return image
+        return text_layer
     
     def _calculate_logo_position(self, logo_width: int, logo_height: int, position: str) -> Tuple[int, int]:
         """
@@ -602,80 +1319,79 @@ class VideoGenerator:
         """
         Generate a single video frame.
         
+        Every intermediate frame and layer stays 8-bit (RGB or RGBA); the
+        NumPy compositing helpers use integer fixed-point math and never
+        allocate float frame buffers.
+        
         Args:
             frame_number: Frame number (0-indexed)
             
         Returns:
             PIL Image for the frame
         """
+        # Get spectrum data
+        self._precompute_audio_features()
+        feature_index = min(frame_number, self._bands_arr.shape[0] - 1)
+        bands = self._bands_arr[feature_index]
+        spectrum_data = self._spectrum_arr[:, feature_index]
+
+        # Beat strength drives shake and beat-synchronized effects
+        beat_shake_enabled = self._beat_shake_enabled
+        beat_sync_enabled = self._beat_sync
+        if beat_shake_enabled or beat_sync_enabled:
+            if frame_number < len(self._beats_arr):
+                beat_strength = float(self._beats_arr[frame_number])
+            else:
+                beat_strength = self.audio_processor.get_beat_strength(frame_number, self.frame_rate)
+        else:
+            beat_strength = 0.0
+
+        # Reuse the previous frame when nothing would change (e.g. silence)
+        frame_key = self._get_frame_key(bands, spectrum_data, beat_strength)
+        if frame_key is not None:
+            last_key, last_frame = self._last_frame
+            if frame_key == last_key:
+                self.frames_reused += 1
+                return last_frame
+
         # Load background (pass frame_number for video backgrounds)
         frame = self._load_background(frame_number)
-        
+
         # Apply beat shake to background
-        if self.settings.get('background_beat_shake_enabled', False):
-            beat_strength = self.audio_processor.get_beat_strength(frame_number, self.frame_rate)
-            shake_intensity = self.settings.get('background_beat_shake_intensity', 50)
-            frame = apply_beat_shake(frame, beat_strength, shake_intensity)
+        if beat_shake_enabled and beat_strength >= 0.01:
+            frame = apply_beat_shake(frame, beat_strength, self._beat_shake_intensity)
         
         # Apply background opacity
-        background_opacity = self.settings.get('background_opacity', 100)
-        if background_opacity < 100:
+        if self._background_opacity < 100:
             frame = frame.convert('RGBA')
-            frame = self._apply_opacity(frame, background_opacity)
+            frame = self._apply_opacity(frame, self._background_opacity)
         
         # Apply background animation
-        animation_type = self.settings.get('background_animation', 'none')
-        total_frames = int(self.audio_processor.get_duration() * self.frame_rate)
-        frame = apply_background_animation(frame, frame_number, animation_type, total_frames)
-        
-        # Get spectrum data
-        num_bands = 64
-        bands = self.audio_processor.get_frame_bands(frame_number, num_bands, self.frame_rate)
-        spectrum_data = self.audio_processor.get_frame_spectrum(frame_number, self.frame_rate)
-        
+        if self._background_animation != 'none':
+            frame = apply_background_animation(frame, frame_number, self._background_animation,
+                                               self._get_total_frames())
+
         # Check if visualizer is enabled
-        if self.settings.get('visualizer_enabled', True):
-            # Use new visualizer system
-            if self.visualizer:
-                spectrum_img = self.visualizer.render(bands, spectrum_data, frame_number)
-            else:
-                # Fallback to old method
-                spectrum_img = self._draw_spectrum_bars(bands, self.width, self.height)
-            
-            # Apply visualizer opacity
-            visualizer_opacity = self.settings.get('visualizer_opacity', 100)
-            if visualizer_opacity < 100:
-                spectrum_img = self._apply_opacity(spectrum_img, visualizer_opacity)
+        if self._visualizer_enabled:
+            spectrum_img = self._get_spectrum_layer(bands, spectrum_data, frame_number)
             
             # Composite spectrum over background
-            frame = Image.alpha_composite(frame.convert('RGBA'), spectrum_img)
-            frame = frame.convert('RGB')
-        else:
-            # No visualizer, just use background
+            frame = self._alpha_composite(frame, spectrum_img)
+        
+        # Effects and compositing below work on an RGB frame
+        if frame.mode != 'RGB':
             frame = frame.convert('RGB')
         
         # Apply beat-synchronized effects
-        beat_sync_enabled = self.settings.get('beat_sync_enabled', False)
-        if beat_sync_enabled:
-            beat_strength = self.audio_processor.get_beat_strength(frame_number, self.frame_rate)
-            
-            beat_effect_type = self.settings.get('beat_effect_type', 'pulse')
-            
-            if beat_effect_type == 'pulse':
-                frame = apply_beat_pulse(frame, beat_strength)
-            elif beat_effect_type == 'flash':
-                flash_color = tuple(self.settings.get('beat_flash_color', [255, 255, 255]))
-                frame = apply_beat_flash(frame, beat_strength, flash_color)
-            elif beat_effect_type == 'strobe':
-                strobe_color = tuple(self.settings.get('beat_strobe_color', [255, 255, 255]))
-                frame = apply_beat_strobe(frame, beat_strength, strobe_color)
-            elif beat_effect_type == 'zoom':
-                frame = apply_beat_zoom(frame, beat_strength)
+        if self._beat_effect is not None:
+            frame = self._beat_effect(frame, beat_strength)
         
         # Apply regular strobe effect (non-beat-synced)
-        if self.settings.get('strobe_enabled', False) and not beat_sync_enabled:
-            strobe_color = tuple(self.settings.get('strobe_color', [255, 255, 255]))
-            frame = apply_strobe(frame, spectrum_data, strobe_color)
+        if self._strobe_enabled and not beat_sync_enabled:
+            frame = apply_strobe(frame, spectrum_data, self._strobe_color)
+        
+        # Top layers are composited together in a single pass
+        top_layers = []
         
         # Add overlay effect (rain, snow, etc.)
         if self.overlay_effect:
@@ -683,44 +1399,57 @@ class VideoGenerator:
             overlay_img = self.overlay_effect.render()
             
             # Apply overlay opacity
-            overlay_opacity = self.settings.get('overlay_opacity', 100)
-            if overlay_opacity < 100:
-                overlay_img = self._apply_opacity(overlay_img, overlay_opacity)
+            if self._overlay_opacity < 100:
+                overlay_img = self._apply_opacity(overlay_img, self._overlay_opacity)
             
-            # Composite overlay
-            frame = frame.convert('RGBA')
-            frame = Image.alpha_composite(frame, overlay_img)
-        
-        # Add text overlay
-        text_overlay = self.settings.get('text_overlay', '')
-        if text_overlay:
-            text_color = tuple(self.settings.get('text_color', [255, 255, 255]))
-            text_position = self.settings.get('text_position', 'center')
-            frame = self._add_text_overlay(frame, text_overlay, text_position, text_color)
-        
-        # Add logo
-        logo_path = self.settings.get('logo_path', '')
-        if logo_path:
-            frame = self._add_logo(frame, logo_path)
-        
+            top_layers.append((overlay_img, (0, 0)))
+        
+        # Add text overlay (pre-rendered sprite)
+        if self._text_overlay:
+            text_sprite = self._get_text_overlay_sprite(self._text_overlay, self._text_position,
+                                                        self._text_color)
+            if text_sprite is not None:
+                top_layers.append(text_sprite)
+        
+        # Add logo (pre-scaled image or text sprite)
+        if self._logo_path:
+            logo_sprite = self._get_logo_sprite()
+            if logo_sprite is not None:
+                top_layers.append(logo_sprite)
+        
+        if top_layers:
+            frame = self._composite_layers(frame, top_layers)
+
+        if frame_key is not None:
+            self._last_frame = (frame_key, frame)
+
         return frame
     
-    def generate_frames(self, output_dir: str, start_frame: int = 0, 
-                       end_frame: Optional[int] = None, progress_callback=None) -> int:
+    def generate_frames(self, output_dir: Optional[str], start_frame: int = 0, 
+                       end_frame: Optional[int] = None, progress_callback=None,
+                       executor: Optional[Executor] = None, workers: Optional[int] = None,
+                       frame_writer: Optional[Callable[[bytes], None]] = None) -> int:
         """
         Generate all video frames with optional multiprocessing.
         
         Args:
-            output_dir: Directory to save frames
+            output_dir: Directory to save frames (unused with frame_writer)
             start_frame: Starting frame number
             end_frame: Ending frame number (None for all frames)
             progress_callback: Callback function(frame_number, total_frames)
+            executor: Executor to render frame batches on, e.g. a pool from
+                create_frame_pool reused across videos (None to create a
+                process pool as needed)
+            workers: Number of worker processes (None to use the
+                'worker_count' setting, 0 for one per CPU core)
+            frame_writer: Callback receiving raw RGB24 frame data in frame
+                order, used instead of saving frame files
             
         Returns:
             Number of frames generated
         """
-        duration = self.audio_processor.get_duration()
-        total_frames = int(duration * self.frame_rate)
+        total_frames = self._get_total_frames()
+        self._precompute_audio_features()
         
         if end_frame is None:
             end_frame = total_frames
@@ -745,58 +1474,328 @@ class VideoGenerator:
             # High quality mode: best quality, slower
             use_multiprocessing = False  # Sequential for consistency
         
+        if workers is None:
+            workers = self.settings.get('worker_count', 0)
+        if not workers:
+            workers = cpu_count()
+        
+        # Frames from stateful effects must be rendered in order by one renderer
+        if self._has_stateful_layers():
+            use_multiprocessing = False
+        
         # Generate frames
-        if use_multiprocessing and (end_frame - start_frame) > 30:
+        if (executor is not None or (use_multiprocessing and workers > 1)) and (end_frame - start_frame) > 30:
             # Use multiprocessing for larger batches
-            return self._generate_frames_parallel(output_dir, start_frame, end_frame, progress_callback)
+            return self._generate_frames_parallel(output_dir, start_frame, end_frame, progress_callback,
+                                                  executor, workers, frame_writer)
         else:
             # Sequential generation
-            return self._generate_frames_sequential(output_dir, start_frame, end_frame, progress_callback)
-    
-    def _generate_frames_sequential(self, output_dir: str, start_frame: int, 
-                                    end_frame: int, progress_callback=None) -> int:
-        """Generate frames sequentially."""
-        for frame_num in range(start_frame, end_frame):
-            frame = self.generate_frame(frame_num)
-            frame_path = os.path.join(output_dir, f'frame_{frame_num:06d}.png')
-            
-            # Apply quality preset for saving
-            quality_preset = self.settings.get('quality_preset', 'balanced')
-            if quality_preset == 'fast':
-                frame.save(frame_path, optimize=False, compress_level=1)
-            elif quality_preset == 'high':
-                frame.save(frame_path, optimize=True, compress_level=9)
-            else:
-                frame.save(frame_path, optimize=True, compress_level=6)
+            return self._generate_frames_sequential(output_dir, start_frame, end_frame, progress_callback,
+                                                    frame_writer)
+    
+    def _save_frame(self, frame: Image.Image, output_dir: str, frame_num: int) -> None:
+        """
+        Save a frame for assemble_video.
+        
+        Frames are written as uncompressed PPM: they are read once by ffmpeg
+        and deleted, so any compression is wasted work.
+        
+        Args:
+            frame: Generated frame
+            output_dir: Frame directory
+            frame_num: Frame number
+        """
+        if frame.mode != 'RGB':
+            frame = frame.convert('RGB')
+        frame.save(os.path.join(output_dir, f'frame_{frame_num:06d}.ppm'), format='PPM')
+    
+    def _frame_to_raw(self, frame: Image.Image) -> bytes:
+        """
+        Get raw RGB24 data for a frame.
+        
+        Args:
+            frame: Generated frame
             
-            if progress_callback:
-                progress_callback(frame_num - start_frame + 1, end_frame - start_frame)
+        Returns:
+            Frame pixels as packed RGB bytes
+        """
+        if frame.mode != 'RGB':
+            frame = frame.convert('RGB')
+        if frame.size != (self.width, self.height):
+            frame = frame.resize((self.width, self.height))
+        return frame.tobytes()
+    
+    def _generate_frames_sequential(self, output_dir: Optional[str], start_frame: int, 
+                                    end_frame: int, progress_callback=None,
+                                    frame_writer: Optional[Callable[[bytes], None]] = None) -> int:
+        """
+        Generate frames sequentially.
+        
+        Frames are written by a single background thread, in order, so the
+        next frame renders while the previous one goes to disk or ffmpeg.
+        
+        Args:
+            output_dir: Directory to save frames (unused with frame_writer)
+            start_frame: Starting frame number
+            end_frame: Ending frame number
+            progress_callback: Callback function(frame_number, total_frames)
+            frame_writer: Callback receiving raw RGB24 frame data in order
+            
+        Returns:
+            Number of frames generated
+        """
+        def write_frame(frame: Image.Image, frame_num: int) -> None:
+            if frame_writer:
+                frame_writer(self._frame_to_raw(frame))
+            else:
+                self._save_frame(frame, output_dir, frame_num)
         
-        return end_frame - start_frame
+        # Bound the frames waiting to be written to cap memory use
+        max_pending = 4
+        pending = deque()
+        
+        # Report progress about twice per second of video, and on the last frame
+        total = end_frame - start_frame
+        progress_every = max(1, self.frame_rate // 2)
+        with ThreadPoolExecutor(max_workers=1) as writer:
+            try:
+                for frame_num in range(start_frame, end_frame):
+                    frame = self.generate_frame(frame_num)
+                    pending.append(writer.submit(write_frame, frame, frame_num))
+                    if len(pending) > max_pending:
+                        pending.popleft().result()
+                    
+                    done = frame_num - start_frame + 1
+                    if progress_callback and (done % progress_every == 0 or done == total):
+                        progress_callback(done, total)
+                
+                while pending:
+                    pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
+        
+        return total
     
-    def _generate_frames_parallel(self, output_dir: str, start_frame: int,
-                                  end_frame: int, progress_callback=None) -> int:
-        """Generate frames in parallel using multiprocessing."""
-        # Note: Multiprocessing with PIL and complex objects can be tricky
-        # For now, use sequential with batching for better progress reporting
-        batch_size = 30
-        frames_generated = 0
+    def _generate_frames_parallel(self, output_dir: Optional[str], start_frame: int, end_frame: int,
+                                  progress_callback=None, executor: Optional[Executor] = None,
+                                  workers: int = 1,
+                                  frame_writer: Optional[Callable[[bytes], None]] = None) -> int:
+        """
+        Generate frames in parallel, in batches of consecutive frames.
         
-        for batch_start in range(start_frame, end_frame, batch_size):
-            batch_end = min(batch_start + batch_size, end_frame)
+        Batches are collected in frame order with a bounded number in
+        flight, so raw frames can be streamed to frame_writer while workers
+        render ahead. Raw frames come back through a shared memory block
+        with one slot per batch in flight rather than being pickled.
+        
+        The generator is pickled once into a shared memory block, and each
+        worker loads it on its first batch of this render, so a pool from
+        create_frame_pool can be reused across videos. Thread pool workers
+        copy the generator instead, each keeping an independent renderer.
+        
+        Args:
+            output_dir: Directory to save frames (unused with frame_writer)
+            start_frame: Starting frame number
+            end_frame: Ending frame number
+            progress_callback: Callback function(frame_number, total_frames)
+            executor: Executor to use (see create_frame_pool), or None to
+                create a process pool for this call
+            workers: Number of worker processes for a created pool
+            frame_writer: Callback receiving raw RGB24 frame data in order
             
-            for frame_num in range(batch_start, batch_end):
-                frame = self.generate_frame(frame_num)
-                frame_path = os.path.join(output_dir, f'frame_{frame_num:06d}.png')
-                frame.save(frame_path, optimize=False)
-                frames_generated += 1
+        Returns:
+            Number of frames generated
+        """
+        logger = get_logger()
+        total = end_frame - start_frame
+        
+        # Analyze audio once here so workers receive the results
+        self._precompute_audio_features()
+        
+        batch_size = max(1, min(30, total // (workers * 4)))
+        batches = iter([list(range(batch_start, min(batch_start + batch_size, end_frame)))
+                        for batch_start in range(start_frame, end_frame, batch_size)])
+        max_in_flight = workers * 2
+        
+        own_executor = executor is None
+        frames_generated = 0
+        writer_called = False
+        shm = None
+        payload = None
+        token = uuid.uuid4().hex
+        try:
+            # Workers load the generator once per render from this block
+            pickled = pickle.dumps(self, protocol=pickle.HIGHEST_PROTOCOL)
+            payload = SharedMemory(create=True, size=len(pickled))
+            payload.buf[:len(pickled)] = pickled
+            del pickled
+            _local_generators[token] = self
+            
+            if frame_writer:
+                # Workers write raw frames into one shared memory slot per
+                # batch in flight; a slot is reused once written to ffmpeg
+                frame_bytes = self.width * self.height * 3
+                slot_bytes = batch_size * frame_bytes
+                shm = SharedMemory(create=True, size=slot_bytes * max_in_flight)
+                free_slots = deque(range(max_in_flight))
+            
+            if own_executor:
+                executor = create_frame_pool(workers)
+            render_batch = partial(_render_frame_batch, token, payload.name)
+            
+            def submit_next_batch():
+                batch = next(batches, None)
+                if batch is None:
+                    return
+                if shm is not None:
+                    slot = free_slots.popleft()
+                    future = executor.submit(render_batch, batch, None, shm.name, slot * slot_bytes)
+                else:
+                    slot = None
+                    future = executor.submit(render_batch, batch, output_dir)
+                pending.append((future, slot))
+            
+            pending = deque()
+            for _ in range(max_in_flight):
+                submit_next_batch()
+            
+            while pending:
+                future, slot = pending.popleft()
+                generated, reused = future.result()
+                if frame_writer:
+                    start = slot * slot_bytes
+                    writer_called = True
+                    with shm.buf[start:start + generated * frame_bytes] as frames_data:
+                        frame_writer(frames_data)
+                    free_slots.append(slot)
+                frames_generated += generated
+                self.frames_reused += reused
+                submit_next_batch()
                 
                 if progress_callback:
-                    progress_callback(frames_generated, end_frame - start_frame)
+                    progress_callback(frames_generated, total)
+            
+            return frames_generated
+        except Exception as e:
+            # Frames already streamed cannot be taken back, and a failed
+            # writer (e.g. ffmpeg exited) would fail again sequentially
+            if writer_called:
+                raise
+            logger.warning(f"Parallel frame generation failed ({e}), falling back to sequential")
+            return self._generate_frames_sequential(output_dir, start_frame, end_frame, progress_callback,
+                                                    frame_writer)
+        finally:
+            if own_executor and executor is not None:
+                executor.shutdown(cancel_futures=True)
+            _local_generators.pop(token, None)
+            if payload is not None:
+                payload.close()
+                payload.unlink()
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+    
+    def _pick_encoder(self) -> str:
+        """
+        Pick the H.264 encoder to use, preferring hardware encoders.
+        
+        Returns:
+            First working encoder from HARDWARE_ENCODERS, or 'libx264'
+        """
+        candidates = HARDWARE_ENCODERS
+        if platform.system() != 'Darwin':
+            candidates = [c for c in candidates if c != 'h264_videotoolbox']
+        for vcodec in candidates:
+            if _encoder_works(vcodec):
+                return vcodec
+        return 'libx264'
+    
+    def _pick_audio_codec(self, audio_path: Optional[str]) -> str:
+        """
+        Pick the audio codec: copy AAC sources, otherwise encode to AAC.
         
-        return frames_generated
+        Args:
+            audio_path: Audio input path
+            
+        Returns:
+            'copy', 'libfdk_aac' when ffmpeg has it, or 'aac'
+        """
+        if audio_path and os.path.exists(audio_path):
+            if _probe_audio_codec(audio_path, os.path.getmtime(audio_path)) == 'aac':
+                return 'copy'
+        return 'libfdk_aac' if 'libfdk_aac' in _list_encoders() else 'aac'
     
-    def assemble_video(self, frames_dir: str, output_path: str, audio_path: str) -> bool:
+    def _get_encoder_args(self, audio_path: Optional[str] = None,
+                          vcodec: Optional[str] = None) -> List[str]:
+        """
+        Get ffmpeg output arguments for the codec and bitrate settings.
+        
+        Args:
+            audio_path: Audio input, copied without re-encoding if it is
+                already AAC
+            vcodec: Video encoder to use (None to pick one from the settings)
+            
+        Returns:
+            List of ffmpeg output options
+        """
+        # Get encoding settings
+        encoding_preset = self.settings.get('encoding_preset', 'medium')
+        use_hw_accel = self.settings.get('use_hardware_acceleration', True)
+        quality_preset = self.settings.get('quality_preset', 'balanced')
+        
+        # Set bitrate based on quality preset
+        if quality_preset == 'fast':
+            video_bitrate = '3000k'
+            audio_bitrate = '128k'
+        elif quality_preset == 'high':
+            video_bitrate = '8000k'
+            audio_bitrate = '256k'
+        else:  # balanced
+            video_bitrate = '5000k'
+            audio_bitrate = '192k'
+        
+        # Determine video codec and settings
+        if vcodec is None:
+            vcodec = self._pick_encoder() if use_hw_accel else 'libx264'
+        pix_fmt = 'yuv420p'
+        if vcodec == 'h264_videotoolbox':
+            # VideoToolbox doesn't use presets, use quality/bitrate instead
+            extra_args = {'b:v': video_bitrate}
+        elif vcodec == 'h264_nvenc':
+            # High-throughput CBR without B-frames
+            pix_fmt = 'nv12'
+            bitrate_kbps = int(video_bitrate.rstrip('k'))
+            extra_args = {'preset': self.settings.get('nvenc_preset', 'p4'),
+                          'tune': 'ull', 'bf': '0', 'rc': 'cbr',
+                          'maxrate': video_bitrate, 'bufsize': f'{bitrate_kbps * 2}k'}
+        elif vcodec != 'libx264':
+            # QSV/AMF take NV12 input and are driven by the bitrate
+            pix_fmt = 'nv12'
+            extra_args = {}
+        else:
+            # Software encoding; add CRF for better quality control
+            extra_args = {'preset': encoding_preset, 'crf': '23'}
+        
+        # Combine video and audio
+        output_args = {
+            'c:v': vcodec,
+            'c:a': self._pick_audio_codec(audio_path),
+            'pix_fmt': pix_fmt,
+            'b:v': video_bitrate,
+            'b:a': audio_bitrate,
+            **extra_args
+        }
+        if output_args['c:a'] == 'copy':
+            del output_args['b:a']
+        
+        args = []
+        for key, value in output_args.items():
+            args += [f'-{key}', str(value)]
+        return args
+    
+    def assemble_video(self, frames_dir: str, output_path: str, audio_path: str,
+                       progress_callback: Optional[Callable[[int], None]] = None) -> bool:
         """
         Assemble frames into video using ffmpeg with hardware acceleration.
         
@@ -804,93 +1803,88 @@ class VideoGenerator:
             frames_dir: Directory containing frame images
             output_path: Output video path
             audio_path: Path to audio file
+            progress_callback: Callback function(frames_encoded)
             
         Returns:
             True if successful, False otherwise
         """
+        logger = get_logger()
+        use_hw_accel = self.settings.get('use_hardware_acceleration', True)
         try:
             # Get frame pattern
-            frame_pattern = os.path.join(frames_dir, 'frame_%06d.png')
-            
-            # Create ffmpeg input for frames
-            frame_input = ffmpeg.input(frame_pattern, framerate=self.frame_rate)
-            
-            # Create ffmpeg input for audio
-            audio_input = ffmpeg.input(audio_path)
-            
-            # Get encoding settings
-            encoding_preset = self.settings.get('encoding_preset', 'medium')
-            use_hw_accel = self.settings.get('use_hardware_acceleration', True)
-            quality_preset = self.settings.get('quality_preset', 'balanced')
+            frame_pattern = os.path.join(frames_dir, 'frame_%06d.ppm')
             
-            # Determine video codec and settings
-            if use_hw_accel:
-                # Try hardware acceleration (macOS VideoToolbox)
-                try:
-                    import platform
-                    if platform.system() == 'Darwin':  # macOS
-                        vcodec = 'h264_videotoolbox'
-                        # VideoToolbox doesn't use presets, use quality/bitrate instead
-                        extra_args = {'b:v': video_bitrate}
-                    else:
-                        # Fallback to software encoding
-                        vcodec = 'libx264'
-                        extra_args = {'preset': encoding_preset, 'crf': '23'}
-                except:
-                    vcodec = 'libx264'
-                    extra_args = {'preset': encoding_preset, 'crf': '23'}
-            else:
-                vcodec = 'libx264'
-                # Add CRF for better quality control
-                extra_args = {'preset': encoding_preset, 'crf': '23'}
-            
-            # Set bitrate based on quality preset
-            if quality_preset == 'fast':
-                video_bitrate = '3000k'
-                audio_bitrate = '128k'
-            elif quality_preset == 'high':
-                video_bitrate = '8000k'
-                audio_bitrate = '256k'
-            else:  # balanced
-                video_bitrate = '5000k'
-                audio_bitrate = '192k'
-            
-            # Combine video and audio
-            output_args = {
-                'vcodec': vcodec,
-                'acodec': 'aac',
-                'pix_fmt': 'yuv420p',
-                'b:v': video_bitrate,
-                'b:a': audio_bitrate,
-                **extra_args
-            }
-            
-            output = ffmpeg.output(
-                frame_input.video,
-                audio_input.audio,
-                output_path,
-                **output_args
-            )
-            
-            # Overwrite output file if exists
-            output = ffmpeg.overwrite_output(output)
-            
-            # Run ffmpeg
-            ffmpeg.run(output, quiet=True, overwrite_output=True)
+            # Try the preferred encoder, then software encoding, on the same frames
+            preferred = self._pick_encoder() if use_hw_accel else 'libx264'
+            for vcodec in dict.fromkeys([preferred, 'libx264']):
+                argv = [
+                    '-y',
+                    '-framerate', str(self.frame_rate), '-i', frame_pattern,
+                    '-i', audio_path,
+                    '-map', '0:v', '-map', '1:a',
+                    *self._get_encoder_args(audio_path, vcodec),
+                    output_path
+                ]
+                
+                # Run ffmpeg
+                if FFmpegProcess(argv, progress_callback).run():
+                    return True
+                logger.warning(f"ffmpeg failed to encode video with {vcodec}")
             
-            return True
+            return False
         except Exception as e:
-            logger = get_logger()
             logger.error(f"Error assembling video: {e}", exc_info=True)
-            # Try fallback without hardware acceleration
-            if use_hw_accel:
-                logger.warning("Retrying without hardware acceleration...")
-                self.settings['use_hardware_acceleration'] = False
-                return self.assemble_video(frames_dir, output_path, audio_path)
             return False
     
+    def encode_frames_piped(self, output_path: str, audio_path: str, total_frames: int,
+                            progress_callback=None, executor: Optional[Executor] = None) -> bool:
+        """
+        Generate frames and stream them to ffmpeg as raw RGB video.
+        
+        Frames never touch the disk, and ffmpeg encodes while frames are
+        still being generated.
+        
+        Args:
+            output_path: Output video path
+            audio_path: Path to audio file
+            total_frames: Number of frames to generate
+            progress_callback: Callback function(current, total) for frame progress
+            executor: Optional executor for frame generation (see generate_frames)
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        logger = get_logger()
+        argv = [
+            '-y',
+            '-f', 'rawvideo', '-pix_fmt', 'rgb24',
+            '-video_size', f'{self.width}x{self.height}',
+            '-framerate', str(self.frame_rate), '-i', 'pipe:0',
+            '-i', audio_path,
+            '-map', '0:v', '-map', '1:a',
+            *self._get_encoder_args(audio_path),
+            output_path
+        ]
+        
+        encoder = FFmpegProcess(argv, pipe_stdin=True)
+        encoder.start()
+        try:
+            self.generate_frames(None, 0, total_frames, progress_callback,
+                                 executor=executor, frame_writer=encoder.write)
+        except BrokenPipeError:
+            logger.error("ffmpeg stopped reading frames")
+            encoder.wait()
+            return False
+        except Exception:
+            encoder.process.kill()
+            encoder.wait()
+            raise
+        
+        return encoder.wait()
+    
     def generate_video(self, output_path: str, progress_callback=None, 
-                      preview_seconds: Optional[int] = None, status_callback=None) -> bool:
+                      preview_seconds: Optional[int] = None, status_callback=None,
+                      executor: Optional[Executor] = None) -> bool:
         """
         Generate complete video file with enhanced progress reporting.
         
@@ -899,15 +1893,14 @@ class VideoGenerator:
             progress_callback: Callback function(current, total) for progress
             preview_seconds: If specified, only generate this many seconds (for preview)
             status_callback: Callback function(status_dict) for detailed status
+            executor: Optional executor for frame generation (see generate_frames)
             
         Returns:
             True if successful, False otherwise
         """
         try:
             start_time = time.time()
-            
-            # Create temp directory for frames
-            temp_dir = self._create_temp_dir()
+            self.frames_reused = 0
             
             # Calculate frame range
             audio_duration = self.audio_processor.get_duration()
@@ -954,28 +1947,57 @@ class VideoGenerator:
                         'current_frame': current,
                         'total_frames': total,
                         'fps': fps,
-                        'eta_seconds': eta
+                        'eta_seconds': eta,
+                        'frames_reused': self.frames_reused
                     })
             
-            self.generate_frames(temp_dir, 0, total_frames, enhanced_progress)
-            
-            # Assemble video
-            if progress_callback:
-                progress_callback(total_frames, total_frames + 1)
-            
-            if status_callback:
-                status_callback({
-                    'stage': 'encoding_video',
-                    'current_frame': total_frames,
-                    'total_frames': total_frames,
-                    'fps': 0,
-                    'eta_seconds': 0
-                })
-            
-            success = self.assemble_video(temp_dir, output_path, self.audio_processor.audio_path)
+            success = False
+            if self.settings.get('use_pipe', True):
+                # Stream raw frames straight into ffmpeg
+                success = self.encode_frames_piped(
+                    output_path, self.audio_processor.audio_path, total_frames,
+                    enhanced_progress, executor
+                )
+                if not success:
+                    logger.warning("Piped encoding failed, retrying with frame files")
+                    self.frames_reused = 0
+                    frame_start_time = time.time()
             
-            # Cleanup
-            self._cleanup_temp_dir()
+            if not success:
+                # Create temp directory for frames (uncompressed RGB files)
+                temp_dir = self._create_temp_dir(total_frames * self.width * self.height * 3)
+                
+                self.generate_frames(temp_dir, 0, total_frames, enhanced_progress, executor=executor)
+                
+                # Assemble video
+                if progress_callback:
+                    progress_callback(total_frames, total_frames + 1)
+                
+                if status_callback:
+                    status_callback({
+                        'stage': 'encoding_video',
+                        'current_frame': 0,
+                        'total_frames': total_frames,
+                        'fps': 0,
+                        'eta_seconds': 0
+                    })
+                
+                def encoding_progress(frames_encoded):
+                    if status_callback:
+                        status_callback({
+                            'stage': 'encoding_video',
+                            'current_frame': min(frames_encoded, total_frames),
+                            'total_frames': total_frames,
+                            'fps': 0,
+                            'eta_seconds': 0
+                        })
+                
+                success = self.assemble_video(
+                    temp_dir, output_path, self.audio_processor.audio_path, encoding_progress
+                )
+                
+                # Cleanup
+                self._cleanup_temp_dir()
             
             if progress_callback:
                 progress_callback(total_frames + 1, total_frames + 1)
@@ -987,7 +2009,8 @@ class VideoGenerator:
                     'current_frame': total_frames,
                     'total_frames': total_frames,
                     'fps': total_frames / total_time if total_time > 0 else 0,
-                    'total_time': total_time
+                    'total_time': total_time,
+                    'frames_reused': self.frames_reused
                 })
             
             return success
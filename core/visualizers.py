@@ -3,10 +3,18 @@ Visualizer module for different audio visualization styles.
 Implements various visualizer types with customizable colors and effects.
 """
 
+import cv2
 import numpy as np
 from PIL import Image, ImageDraw
 from typing import Tuple, Optional, Dict, Any
 import math
+import threading
+
+from core.visualizers_numba import update_particles
+
+
+# Resolution of the magnitude → color lookup tables
+COLOR_LUT_SIZE = 4096
 
 
 class BaseVisualizer:
@@ -24,6 +32,42 @@ class BaseVisualizer:
         self.width = width
         self.height = height
         self.settings = settings
+        
+        # Color settings are read for every element drawn; look them up once
+        self._gradient_type = settings.get('color_gradient', 'frequency-based')
+        self._custom_color_start = settings.get('custom_color_start', [255, 0, 255])
+        self._custom_color_end = settings.get('custom_color_end', [0, 255, 255])
+        self._monochrome_base_color = settings.get('monochrome_color', [255, 255, 255])
+        
+        # Gradients that only depend on magnitude are tabulated once; the
+        # others are a per-index base color scaled by magnitude brightness
+        magnitude_gradients = {
+            'energy-based': self._energy_based_color,
+            'monochrome': self._monochrome_color,
+            'fire': self._fire_color,
+        }
+        self._color_lut = None
+        self._color_lut_tuples = None
+        if self._gradient_type in magnitude_gradients:
+            color_fn = magnitude_gradients[self._gradient_type]
+            self._color_lut_tuples = [color_fn(i / (COLOR_LUT_SIZE - 1))
+                                      for i in range(COLOR_LUT_SIZE)]
+            self._color_lut = np.array(self._color_lut_tuples, dtype=np.int32)
+        
+        brightness_gradients = {
+            'pitch_rainbow': self._pitch_rainbow_base,
+            'custom': self._custom_base,
+            'neon': self._neon_base,
+            'sunset': self._sunset_base,
+            'ocean': self._ocean_base,
+        }
+        self._apply_brightness = self._gradient_type in brightness_gradients
+        self._base_color_fn = brightness_gradients.get(self._gradient_type,
+                                                       self._frequency_based_base)
+        self._base_colors: Dict[int, np.ndarray] = {}
+        
+        # Reused output buffer for _normalize, one per rendering thread
+        self._norm_local = threading.local()
     
     def render(self, bands: np.ndarray, spectrum_data: np.ndarray, 
                frame_number: int) -> Image.Image:
@@ -40,6 +84,27 @@ class BaseVisualizer:
         """
         raise NotImplementedError("Subclasses must implement render()")
     
+    def _normalize(self, bands: np.ndarray) -> np.ndarray:
+        """
+        Scale bands so the loudest one is 1.0.
+        
+        The result is written into a buffer reused by every render call on
+        the same thread, so it is only valid until that thread's next call.
+        
+        Args:
+            bands: Frequency band magnitudes
+            
+        Returns:
+            Normalized bands, or the bands unchanged if they are all silent
+        """
+        max_band = np.max(bands)
+        if not max_band > 0:
+            return bands
+        norm_buf = getattr(self._norm_local, 'buf', None)
+        if norm_buf is None or norm_buf.shape != bands.shape:
+            norm_buf = self._norm_local.buf = np.empty(bands.shape, dtype=np.float64)
+        return np.divide(bands, max_band, out=norm_buf)
+    
     def get_color(self, index: int, total: int, magnitude: float) -> Tuple[int, int, int, int]:
         """
         Get color for visualization based on gradient settings.
@@ -52,30 +117,64 @@ class BaseVisualizer:
         Returns:
             RGBA color tuple
         """
-        gradient_type = self.settings.get('color_gradient', 'frequency-based')
-        
-        if gradient_type == 'pitch_rainbow':
-            return self._pitch_rainbow_color(index, total, magnitude)
-        elif gradient_type == 'frequency-based':
-            return self._frequency_based_color(index, total, magnitude)
-        elif gradient_type == 'energy-based':
-            return self._energy_based_color(magnitude)
-        elif gradient_type == 'custom':
-            return self._custom_color(index, total, magnitude)
-        elif gradient_type == 'monochrome':
-            return self._monochrome_color(magnitude)
-        elif gradient_type == 'neon':
-            return self._neon_color(index, total, magnitude)
-        elif gradient_type == 'sunset':
-            return self._sunset_color(index, total, magnitude)
-        elif gradient_type == 'ocean':
-            return self._ocean_color(index, total, magnitude)
-        elif gradient_type == 'fire':
-            return self._fire_color(magnitude)
+        if self._color_lut_tuples is not None:
+            magnitude = min(max(magnitude, 0.0), 1.0)
+            return self._color_lut_tuples[int(magnitude * (COLOR_LUT_SIZE - 1) + 0.5)]
+        
+        if 0 <= index < total:
+            r, g, b = self._get_base_colors(total)[index].tolist()
         else:
-            return self._frequency_based_color(index, total, magnitude)
+            r, g, b = self._base_color_fn(index, total)
+        
+        if self._apply_brightness:
+            # Apply magnitude as brightness
+            brightness = 0.5 + (magnitude * 0.5)
+            return (int(r * brightness), int(g * brightness), int(b * brightness), 255)
+        return (int(r), int(g), int(b), 255)
+    
+    def get_colors(self, magnitudes: np.ndarray) -> np.ndarray:
+        """
+        Get colors for all elements at once, element i colored as get_color(i, n, magnitudes[i]).
+        
+        Args:
+            magnitudes: Magnitude values (0.0 to 1.0), one per element
+            
+        Returns:
+            Integer array of shape (n, 4) with RGBA colors
+        """
+        magnitudes = np.asarray(magnitudes, dtype=np.float64)
+        
+        if self._color_lut is not None:
+            lut_index = (np.clip(magnitudes, 0.0, 1.0) * (COLOR_LUT_SIZE - 1) + 0.5).astype(np.intp)
+            return self._color_lut[lut_index]
+        
+        base = self._get_base_colors(len(magnitudes))
+        if self._apply_brightness:
+            brightness = 0.5 + (magnitudes * 0.5)
+            base = base * brightness[:, None]
+        
+        colors = np.full((len(magnitudes), 4), 255, dtype=np.int32)
+        colors[:, :3] = base.astype(np.int32)
+        return colors
     
-    def _pitch_rainbow_color(self, index: int, total: int, magnitude: float) -> Tuple[int, int, int, int]:
+    def _get_base_colors(self, total: int) -> np.ndarray:
+        """
+        Get the unscaled gradient colors for every index, computed once per total.
+        
+        Args:
+            total: Total number of elements
+            
+        Returns:
+            Float array of shape (total, 3) with RGB base colors
+        """
+        base = self._base_colors.get(total)
+        if base is None:
+            base = np.array([self._base_color_fn(i, total) for i in range(total)],
+                            dtype=np.float64).reshape(total, 3)
+            self._base_colors[total] = base
+        return base
+    
+    def _pitch_rainbow_base(self, index: int, total: int) -> Tuple[float, float, float]:
         """Rainbow spectrum based on pitch/frequency."""
         # Map index to hue (0-360)
         hue = (index / total) * 360
@@ -96,33 +195,27 @@ class BaseVisualizer:
         else:
             r, g, b = 1, 0, x
         
-        # Apply magnitude as brightness
-        brightness = 0.5 + (magnitude * 0.5)
-        r = int(r * 255 * brightness)
-        g = int(g * 255 * brightness)
-        b = int(b * 255 * brightness)
-        
-        return (r, g, b, 255)
+        return (r * 255, g * 255, b * 255)
     
-    def _frequency_based_color(self, index: int, total: int, magnitude: float) -> Tuple[int, int, int, int]:
+    def _frequency_based_base(self, index: int, total: int) -> Tuple[float, float, float]:
         """Color based on frequency range: low=red, mid=green, high=blue."""
         if index < total / 3:
             # Low frequency - red to yellow
             r = 255
-            g = int(255 * (index / (total / 3)))
+            g = 255 * (index / (total / 3))
             b = 0
         elif index < total * 2 / 3:
             # Mid frequency - yellow to cyan
-            r = int(255 * (1 - (index - total / 3) / (total / 3)))
+            r = 255 * (1 - (index - total / 3) / (total / 3))
             g = 255
-            b = int(255 * ((index - total / 3) / (total / 3)))
+            b = 255 * ((index - total / 3) / (total / 3))
         else:
             # High frequency - cyan to blue
             r = 0
-            g = int(255 * (1 - (index - total * 2 / 3) / (total / 3)))
+            g = 255 * (1 - (index - total * 2 / 3) / (total / 3))
             b = 255
         
-        return (r, g, b, 255)
+        return (r, g, b)
     
     def _energy_based_color(self, magnitude: float) -> Tuple[int, int, int, int]:
         """Color intensity based on energy/amplitude."""
@@ -142,10 +235,10 @@ class BaseVisualizer:
         
         return (r, g, b, 255)
     
-    def _custom_color(self, index: int, total: int, magnitude: float) -> Tuple[int, int, int, int]:
+    def _custom_base(self, index: int, total: int) -> Tuple[int, int, int]:
         """Custom gradient between two user-defined colors."""
-        start_color = self.settings.get('custom_color_start', [255, 0, 255])
-        end_color = self.settings.get('custom_color_end', [0, 255, 255])
+        start_color = self._custom_color_start
+        end_color = self._custom_color_end
         
         # Interpolate between start and end colors
         t = index / total if total > 0 else 0
@@ -153,17 +246,11 @@ class BaseVisualizer:
         g = int(start_color[1] + (end_color[1] - start_color[1]) * t)
         b = int(start_color[2] + (end_color[2] - start_color[2]) * t)
         
-        # Apply magnitude as brightness
-        brightness = 0.5 + (magnitude * 0.5)
-        r = int(r * brightness)
-        g = int(g * brightness)
-        b = int(b * brightness)
-        
-        return (r, g, b, 255)
+        return (r, g, b)
     
     def _monochrome_color(self, magnitude: float) -> Tuple[int, int, int, int]:
         """Single color with varying intensity."""
-        base_color = self.settings.get('monochrome_color', [255, 255, 255])
+        base_color = self._monochrome_base_color
         
         r = int(base_color[0] * magnitude)
         g = int(base_color[1] * magnitude)
@@ -171,81 +258,78 @@ class BaseVisualizer:
         
         return (r, g, b, 255)
     
-    def _neon_color(self, index: int, total: int, magnitude: float) -> Tuple[int, int, int, int]:
+    def _neon_base(self, index: int, total: int) -> Tuple[float, float, float]:
         """Neon colors: vibrant cyan, magenta, yellow."""
         t = index / total if total > 0 else 0
-        brightness = 0.5 + (magnitude * 0.5)
         
         if t < 0.33:
             # Cyan to magenta
-            r = int(255 * (t / 0.33) * brightness)
-            g = int(255 * (1 - t / 0.33) * brightness)
-            b = int(255 * brightness)
+            r = 255 * (t / 0.33)
+            g = 255 * (1 - t / 0.33)
+            b = 255
         elif t < 0.66:
             # Magenta to yellow
             t_local = (t - 0.33) / 0.33
-            r = int(255 * brightness)
-            g = int(255 * t_local * brightness)
-            b = int(255 * (1 - t_local) * brightness)
+            r = 255
+            g = 255 * t_local
+            b = 255 * (1 - t_local)
         else:
             # Yellow to cyan
             t_local = (t - 0.66) / 0.34
-            r = int(255 * (1 - t_local) * brightness)
-            g = int(255 * brightness)
-            b = int(255 * t_local * brightness)
+            r = 255 * (1 - t_local)
+            g = 255
+            b = 255 * t_local
         
-        return (r, g, b, 255)
+        return (r, g, b)
     
-    def _sunset_color(self, index: int, total: int, magnitude: float) -> Tuple[int, int, int, int]:
+    def _sunset_base(self, index: int, total: int) -> Tuple[float, float, float]:
         """Sunset gradient: purple, orange, pink, yellow."""
         t = index / total if total > 0 else 0
-        brightness = 0.5 + (magnitude * 0.5)
         
         if t < 0.25:
             # Purple to orange
             t_local = t / 0.25
-            r = int((128 + 127 * t_local) * brightness)
-            g = int((0 + 165 * t_local) * brightness)
-            b = int((128 - 128 * t_local) * brightness)
+            r = 128 + 127 * t_local
+            g = 0 + 165 * t_local
+            b = 128 - 128 * t_local
         elif t < 0.5:
             # Orange to pink
             t_local = (t - 0.25) / 0.25
-            r = int((255 - 0 * t_local) * brightness)
-            g = int((165 - 73 * t_local) * brightness)
-            b = int((0 + 203 * t_local) * brightness)
+            r = 255 - 0 * t_local
+            g = 165 - 73 * t_local
+            b = 0 + 203 * t_local
         elif t < 0.75:
             # Pink to yellow
             t_local = (t - 0.5) / 0.25
-            r = int(255 * brightness)
-            g = int((92 + 163 * t_local) * brightness)
-            b = int((203 - 203 * t_local) * brightness)
+            r = 255
+            g = 92 + 163 * t_local
+            b = 203 - 203 * t_local
         else:
             # Yellow
-            r = int(255 * brightness)
-            g = int(255 * brightness)
-            b = int(0 * brightness)
+            r = 255
+            g = 255
+            b = 0
         
-        return (r, g, b, 255)
+        return (r, g, b)
     
-    def _ocean_color(self, index: int, total: int, magnitude: float) -> Tuple[int, int, int, int]:
+    def _ocean_base(self, index: int, total: int) -> Tuple[float, float, float]:
         """Ocean gradient: deep blue, cyan, turquoise."""
         t = index / total if total > 0 else 0
-        brightness = 0.5 + (magnitude * 0.5)
         
         if t < 0.5:
             # Deep blue to cyan
             t_local = t / 0.5
-            r = int((0 + 0 * t_local) * brightness)
-            g = int((105 + 150 * t_local) * brightness)
-            b = int((148 + 107 * t_local) * brightness)
+            r = 0 + 0 * t_local
+            g = 105 + 150 * t_local
+            b = 148 + 107 * t_local
         else:
             # Cyan to turquoise
             t_local = (t - 0.5) / 0.5
-            r = int((0 + 64 * t_local) * brightness)
-            g = int((255 - 31 * t_local) * brightness)
-            b = int((255 - 47 * t_local) * brightness)
+            r = 0 + 64 * t_local
+            g = 255 - 31 * t_local
+            b = 255 - 47 * t_local
         
-        return (r, g, b, 255)
+        return (r, g, b)
     
     def _fire_color(self, magnitude: float) -> Tuple[int, int, int, int]:
         """Fire gradient based on intensity: black, red, orange, yellow, white."""
@@ -277,6 +361,82 @@ class BaseVisualizer:
         return (r, g, b, 255)
 
 
+class ParticleSystem:
+    """Particle state kept in fixed-size parallel arrays and advanced by a Numba kernel."""
+    
+    def __init__(self, capacity: int, gravity: float, decay: float):
+        """
+        Initialize an empty particle system.
+        
+        Args:
+            capacity: Maximum number of live particles
+            gravity: Added to each particle's vertical velocity per frame
+            decay: Subtracted from each particle's life per frame
+        """
+        self.capacity = capacity
+        self.gravity = gravity
+        self.decay = decay
+        self.count = 0
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.vx = np.zeros(capacity)
+        self.vy = np.zeros(capacity)
+        self.life = np.zeros(capacity)
+        self.colors = np.zeros((capacity, 4), dtype=np.int32)
+        self.sizes = np.zeros(capacity, dtype=np.int32)
+    
+    def __len__(self) -> int:
+        return self.count
+    
+    def spawn(self, x: np.ndarray, y: np.ndarray, vx: np.ndarray, vy: np.ndarray,
+              colors: np.ndarray, sizes: np.ndarray) -> None:
+        """
+        Add new particles with full life, as many as there is room for.
+        
+        Args:
+            x, y: Spawn positions
+            vx, vy: Initial velocities
+            colors: RGBA colors, shape (n, 4)
+            sizes: Particle radii in pixels
+        """
+        start = self.count
+        end = min(self.capacity, start + len(x))
+        n = end - start
+        self.x[start:end] = x[:n]
+        self.y[start:end] = y[:n]
+        self.vx[start:end] = vx[:n]
+        self.vy[start:end] = vy[:n]
+        self.life[start:end] = 1.0
+        self.colors[start:end] = colors[:n]
+        self.sizes[start:end] = sizes[:n]
+        self.count = end
+    
+    def update_and_draw(self, draw: ImageDraw.ImageDraw, width: int, height: int) -> None:
+        """
+        Advance all particles one frame, drop dead or off-screen ones and draw the rest.
+        
+        Args:
+            draw: Drawing context of the RGBA layer
+            width: Image width
+            height: Image height
+        """
+        if not self.count:
+            return
+        
+        self.count = update_particles(self.x, self.y, self.vx, self.vy, self.life,
+                                      self.colors, self.sizes, self.count,
+                                      self.gravity, self.decay, width, height)
+        
+        n = self.count
+        for x, y, life, (r, g, b, _), size in zip(self.x[:n].tolist(), self.y[:n].tolist(),
+                                                   self.life[:n].tolist(), self.colors[:n].tolist(),
+                                                   self.sizes[:n].tolist()):
+            x, y = int(x), int(y)
+            # Fade color based on life
+            color = (r, g, b, int(255 * life))
+            draw.ellipse([x - size, y - size, x + size, y + size], fill=color)
+
+
 class BarsVisualizer(BaseVisualizer):
     """Classic spectrum bars visualization."""
     
@@ -292,18 +452,14 @@ class BarsVisualizer(BaseVisualizer):
         draw = ImageDraw.Draw(img)
         
         # Normalize bands
-        if np.max(bands) > 0:
-            normalized_bands = bands / np.max(bands)
-        else:
-            normalized_bands = bands
+        normalized_bands = self._normalize(bands)
         
         # Draw bars
-        for i, magnitude in enumerate(normalized_bands):
-            bar_height = int(magnitude * self.height * 0.8)
+        colors = [tuple(c) for c in self.get_colors(normalized_bands).tolist()]
+        bar_heights = (normalized_bands * self.height * 0.8).astype(np.int64).tolist()
+        for i, (bar_height, color) in enumerate(zip(bar_heights, colors)):
             x = i * bar_width + bar_spacing
             
-            color = self.get_color(i, num_bands, magnitude)
-            
             # Draw bar from bottom
             # Ensure bar_height doesn't exceed height and coordinates are valid
             bar_height = min(bar_height, self.height)
@@ -330,22 +486,15 @@ class FilledWaveformVisualizer(BaseVisualizer):
             return img
         
         # Normalize bands
-        if np.max(bands) > 0:
-            normalized_bands = bands / np.max(bands)
-        else:
-            normalized_bands = bands
+        normalized_bands = self._normalize(bands)
         
         # Create waveform points
-        points_top = []
-        points_bottom = []
         center_y = self.height // 2
+        xs = ((np.arange(num_points) / num_points) * self.width).astype(np.int64)
+        wave_height = (normalized_bands * self.height * 0.4).astype(np.int64)
         
-        for i, magnitude in enumerate(normalized_bands):
-            x = int((i / num_points) * self.width)
-            wave_height = int(magnitude * self.height * 0.4)
-            
-            points_top.append((x, center_y - wave_height))
-            points_bottom.append((x, center_y + wave_height))
+        points_top = list(zip(xs.tolist(), (center_y - wave_height).tolist()))
+        points_bottom = list(zip(xs.tolist(), (center_y + wave_height).tolist()))
         
         # Draw filled polygon
         all_points = points_top + points_bottom[::-1]
@@ -363,6 +512,37 @@ class FilledWaveformVisualizer(BaseVisualizer):
 class CircleVisualizer(BaseVisualizer):
     """Circular spectrum analyzer."""
     
+    def __init__(self, width: int, height: int, settings: Dict[str, Any]):
+        """Initialize circle visualizer."""
+        super().__init__(width, height, settings)
+        self._spokes: Dict[int, Tuple[np.ndarray, np.ndarray, list, list]] = {}
+        self.center_x = width // 2
+        self.center_y = height // 2
+        self.base_radius = min(width, height) // 4
+        self.max_bar_length = min(width, height) // 3
+    
+    def _get_spokes(self, num_bands: int) -> Tuple[np.ndarray, np.ndarray, list, list]:
+        """
+        Get the frame-invariant geometry of the bars, computed once per band count.
+        
+        Args:
+            num_bands: Number of frequency bands
+            
+        Returns:
+            Tuple of (cosines, sines, start x list, start y list) per bar
+        """
+        spokes = self._spokes.get(num_bands)
+        if spokes is None:
+            angles = (np.arange(num_bands) / num_bands) * 2 * math.pi
+            cos_a = np.cos(angles)
+            sin_a = np.sin(angles)
+            # Bars start on the base circle
+            x1 = (self.center_x + (self.base_radius * cos_a).astype(np.int64)).tolist()
+            y1 = (self.center_y + (self.base_radius * sin_a).astype(np.int64)).tolist()
+            spokes = (cos_a, sin_a, x1, y1)
+            self._spokes[num_bands] = spokes
+        return spokes
+    
     def render(self, bands: np.ndarray, spectrum_data: np.ndarray, 
                frame_number: int) -> Image.Image:
         """Render circular spectrum."""
@@ -370,34 +550,22 @@ class CircleVisualizer(BaseVisualizer):
         draw = ImageDraw.Draw(img)
         
         num_bands = len(bands)
-        center_x = self.width // 2
-        center_y = self.height // 2
-        base_radius = min(self.width, self.height) // 4
-        max_bar_length = min(self.width, self.height) // 3
         
         # Normalize bands
-        if np.max(bands) > 0:
-            normalized_bands = bands / np.max(bands)
-        else:
-            normalized_bands = bands
+        normalized_bands = self._normalize(bands)
+        
+        cos_a, sin_a, x1, y1 = self._get_spokes(num_bands)
+        outer_radius = self.base_radius + normalized_bands * self.max_bar_length
+        
+        # End points
+        x2 = self.center_x + (outer_radius * cos_a).astype(np.int64)
+        y2 = self.center_y + (outer_radius * sin_a).astype(np.int64)
         
         # Draw bars radiating from center
-        for i, magnitude in enumerate(normalized_bands):
-            angle = (i / num_bands) * 2 * math.pi
-            bar_length = magnitude * max_bar_length
-            
-            # Start point
-            x1 = center_x + int(base_radius * math.cos(angle))
-            y1 = center_y + int(base_radius * math.sin(angle))
-            
-            # End point
-            x2 = center_x + int((base_radius + bar_length) * math.cos(angle))
-            y2 = center_y + int((base_radius + bar_length) * math.sin(angle))
-            
-            color = self.get_color(i, num_bands, magnitude)
-            
+        colors = [tuple(c) for c in self.get_colors(normalized_bands).tolist()]
+        for x_start, y_start, x_end, y_end, color in zip(x1, y1, x2.tolist(), y2.tolist(), colors):
             # Draw line with width
-            draw.line([(x1, y1), (x2, y2)], fill=color, width=3)
+            draw.line([(x_start, y_start), (x_end, y_end)], fill=color, width=3)
         
         return img
 
@@ -416,24 +584,16 @@ class LineWaveformVisualizer(BaseVisualizer):
             return img
         
         # Normalize bands
-        if np.max(bands) > 0:
-            normalized_bands = bands / np.max(bands)
-        else:
-            normalized_bands = bands
+        normalized_bands = self._normalize(bands)
         
         # Create waveform points
-        points = []
         center_y = self.height // 2
+        xs = ((np.arange(num_points) / num_points) * self.width).astype(np.int64)
+        wave_height = (normalized_bands * self.height * 0.4).astype(np.int64)
         
-        for i, magnitude in enumerate(normalized_bands):
-            x = int((i / num_points) * self.width)
-            # Alternate above and below center for waveform effect
-            wave_height = int(magnitude * self.height * 0.4)
-            if i % 2 == 0:
-                y = center_y - wave_height
-            else:
-                y = center_y + wave_height
-            points.append((x, y))
+        # Alternate above and below center for waveform effect
+        wave_height[::2] *= -1
+        points = list(zip(xs.tolist(), (center_y + wave_height).tolist()))
         
         # Draw line
         if len(points) >= 2:
@@ -452,8 +612,9 @@ class ParticleVisualizer(BaseVisualizer):
     def __init__(self, width: int, height: int, settings: Dict[str, Any]):
         """Initialize particle visualizer."""
         super().__init__(width, height, settings)
-        self.particles = []
         self.max_particles = 200
+        self.particles = ParticleSystem(self.max_particles, gravity=0.5, decay=0.02)
+        self._rng = np.random.default_rng()
     
     def render(self, bands: np.ndarray, spectrum_data: np.ndarray, 
                frame_number: int) -> Image.Image:
@@ -464,64 +625,25 @@ class ParticleVisualizer(BaseVisualizer):
         num_bands = len(bands)
         
         # Normalize bands
-        if np.max(bands) > 0:
-            normalized_bands = bands / np.max(bands)
-        else:
-            normalized_bands = bands
+        normalized_bands = self._normalize(bands)
         
         # Generate new particles based on audio intensity
-        for i, magnitude in enumerate(normalized_bands):
-            if magnitude > 0.3 and len(self.particles) < self.max_particles:
-                # Create particle
-                x = int((i / num_bands) * self.width)
-                y = self.height // 2
-                
-                # Random velocity based on magnitude
-                vx = (np.random.random() - 0.5) * magnitude * 20
-                vy = (np.random.random() - 0.5) * magnitude * 20
-                
-                color = self.get_color(i, num_bands, magnitude)
-                
-                self.particles.append({
-                    'x': x,
-                    'y': y,
-                    'vx': vx,
-                    'vy': vy,
-                    'life': 1.0,
-                    'color': color,
-                    'size': int(magnitude * 10) + 2
-                })
-        
-        # Update and draw particles
-        new_particles = []
-        for particle in self.particles:
-            # Update position
-            particle['x'] += particle['vx']
-            particle['y'] += particle['vy']
-            
-            # Apply gravity
-            particle['vy'] += 0.5
+        room = max(0, self.max_particles - len(self.particles))
+        spawn = np.flatnonzero(normalized_bands > 0.3)[:room]
+        if len(spawn):
+            magnitude = normalized_bands[spawn]
+            x = ((spawn / num_bands) * self.width).astype(np.int64)
+            y = np.full(len(spawn), self.height // 2)
             
-            # Reduce life
-            particle['life'] -= 0.02
+            # Random velocity based on magnitude (vx, vy drawn per particle)
+            velocity = (self._rng.random((len(spawn), 2)) - 0.5) * magnitude[:, None] * 20
             
-            # Keep particle if still alive and in bounds
-            if particle['life'] > 0:
-                # Draw particle
-                x = int(particle['x'])
-                y = int(particle['y'])
-                size = particle['size']
-                
-                # Fade color based on life
-                r, g, b, a = particle['color']
-                a = int(255 * particle['life'])
-                color = (r, g, b, a)
-                
-                if 0 <= x < self.width and 0 <= y < self.height:
-                    draw.ellipse([x - size, y - size, x + size, y + size], fill=color)
-                    new_particles.append(particle)
+            colors = self.get_colors(normalized_bands)[spawn]
+            sizes = (magnitude * 10).astype(np.int32) + 2
+            self.particles.spawn(x, y, velocity[:, 0], velocity[:, 1], colors, sizes)
         
-        self.particles = new_particles
+        # Update and draw particles
+        self.particles.update_and_draw(draw, self.width, self.height)
         
         return img
 
@@ -541,20 +663,16 @@ class NCSBarsVisualizer(BaseVisualizer):
         draw = ImageDraw.Draw(img)
         
         # Normalize bands
-        if np.max(bands) > 0:
-            normalized_bands = bands / np.max(bands)
-        else:
-            normalized_bands = bands
+        normalized_bands = self._normalize(bands)
         
         # Draw bars centered vertically
         center_y = self.height // 2
         
-        for i, magnitude in enumerate(normalized_bands):
-            bar_height = int(magnitude * self.height * 0.4)
+        colors = [tuple(c) for c in self.get_colors(normalized_bands).tolist()]
+        bar_heights = (normalized_bands * self.height * 0.4).astype(np.int64).tolist()
+        for i, (bar_height, color) in enumerate(zip(bar_heights, colors)):
             x = i * bar_width + bar_spacing
             
-            color = self.get_color(i, num_bands, magnitude)
-            
             # Draw bar symmetrically from center
             # Ensure bar_height doesn't exceed half height and coordinates are valid
             max_bar_height = min(bar_height, center_y, self.height - center_y)
@@ -570,20 +688,29 @@ class NCSBarsVisualizer(BaseVisualizer):
         return img
     
     def _apply_glow(self, image: Image.Image, radius: int = 10, iterations: int = 2) -> Image.Image:
-        """Apply glow/bloom effect to image."""
-        from PIL import ImageFilter
-        
-        # Create a copy for glowing
-        glow = image.copy()
-        
-        # Apply multiple blur passes for stronger glow
-        for _ in range(iterations):
-            glow = glow.filter(ImageFilter.GaussianBlur(radius=radius))
+        """
+        Apply glow/bloom effect to image.
         
-        # Blend glow with original
-        result = Image.new('RGBA', image.size, (0, 0, 0, 0))
-        result = Image.alpha_composite(result, glow)
-        result = Image.alpha_composite(result, image)
+        The glow only holds low frequencies, so it is blurred at half
+        resolution with three box passes per Gaussian iteration (the same
+        approximation PIL's GaussianBlur uses) and scaled back up.
+        """
+        pixels = np.asarray(image)
+        height, width = pixels.shape[:2]
+        
+        # Blur a half-size copy for glowing
+        glow = cv2.resize(pixels, (max(1, width // 2), max(1, height // 2)),
+                          interpolation=cv2.INTER_AREA)
+        # A box about 2 * radius wide at full size matches the Gaussian's spread
+        box_size = max(1, radius) | 1
+        for _ in range(3 * iterations):
+            glow = cv2.blur(glow, (box_size, box_size), borderType=cv2.BORDER_REPLICATE)
+        glow = cv2.resize(glow, (width, height), interpolation=cv2.INTER_LINEAR)
+        
+        # Blend glow with original (compositing the glow over a transparent
+        # image only clears the color of fully transparent pixels)
+        glow = cv2.bitwise_and(glow, glow, mask=np.ascontiguousarray(glow[..., 3]))
+        result = Image.alpha_composite(Image.fromarray(glow, 'RGBA'), image)
         
         return result
 
@@ -602,19 +729,15 @@ class DualSpectrumVisualizer(BaseVisualizer):
         draw = ImageDraw.Draw(img)
         
         # Normalize bands
-        if np.max(bands) > 0:
-            normalized_bands = bands / np.max(bands)
-        else:
-            normalized_bands = bands
+        normalized_bands = self._normalize(bands)
         
         center_y = self.height // 2
         
-        for i, magnitude in enumerate(normalized_bands):
-            bar_height = int(magnitude * self.height * 0.45)
+        colors = [tuple(c) for c in self.get_colors(normalized_bands).tolist()]
+        bar_heights = (normalized_bands * self.height * 0.45).astype(np.int64).tolist()
+        for i, (bar_height, color) in enumerate(zip(bar_heights, colors)):
             x = i * bar_width + bar_spacing
             
-            color = self.get_color(i, num_bands, magnitude)
-            
             # Top bars (mirrored down from center)
             draw.rectangle([x, center_y - bar_height, x + bar_width - bar_spacing, center_y], fill=color)
             
@@ -630,8 +753,9 @@ class WaveformParticleVisualizer(BaseVisualizer):
     def __init__(self, width: int, height: int, settings: Dict[str, Any]):
         """Initialize hybrid visualizer."""
         super().__init__(width, height, settings)
-        self.particles = []
         self.max_particles = 150
+        self.particles = ParticleSystem(self.max_particles, gravity=0.3, decay=0.03)
+        self._rng = np.random.default_rng()
     
     def render(self, bands: np.ndarray, spectrum_data: np.ndarray, 
                frame_number: int) -> Image.Image:
@@ -644,20 +768,13 @@ class WaveformParticleVisualizer(BaseVisualizer):
             return img
         
         # Normalize bands
-        if np.max(bands) > 0:
-            normalized_bands = bands / np.max(bands)
-        else:
-            normalized_bands = bands
+        normalized_bands = self._normalize(bands)
         
         # Draw waveform
-        points = []
         center_y = self.height // 2
-        
-        for i, magnitude in enumerate(normalized_bands):
-            x = int((i / num_points) * self.width)
-            wave_height = int(magnitude * self.height * 0.3)
-            y = center_y - wave_height
-            points.append((x, y))
+        xs = ((np.arange(num_points) / num_points) * self.width).astype(np.int64)
+        wave_height = (normalized_bands * self.height * 0.3).astype(np.int64)
+        points = list(zip(xs.tolist(), (center_y - wave_height).tolist()))
         
         if len(points) >= 2:
             avg_magnitude = np.mean(normalized_bands)
@@ -665,41 +782,24 @@ class WaveformParticleVisualizer(BaseVisualizer):
             draw.line(points, fill=color, width=3)
         
         # Generate particles at peaks
-        for i, magnitude in enumerate(normalized_bands):
-            if magnitude > 0.5 and len(self.particles) < self.max_particles:
-                x = int((i / num_points) * self.width)
-                y = center_y - int(magnitude * self.height * 0.3)
-                
-                vx = (np.random.random() - 0.5) * 5
-                vy = -np.random.random() * 5
-                
-                color = self.get_color(i, num_points, magnitude)
-                
-                self.particles.append({
-                    'x': x, 'y': y, 'vx': vx, 'vy': vy,
-                    'life': 1.0, 'color': color, 'size': 3
-                })
-        
-        # Update and draw particles
-        new_particles = []
-        for particle in self.particles:
-            particle['x'] += particle['vx']
-            particle['y'] += particle['vy']
-            particle['vy'] += 0.3  # gravity
-            particle['life'] -= 0.03
+        room = max(0, self.max_particles - len(self.particles))
+        spawn = np.flatnonzero(normalized_bands > 0.5)[:room]
+        if len(spawn):
+            magnitude = normalized_bands[spawn]
+            x = ((spawn / num_points) * self.width).astype(np.int64)
+            y = center_y - (magnitude * self.height * 0.3).astype(np.int64)
             
-            if particle['life'] > 0:
-                x, y = int(particle['x']), int(particle['y'])
-                size = particle['size']
-                r, g, b, a = particle['color']
-                a = int(255 * particle['life'])
-                color = (r, g, b, a)
-                
-                if 0 <= x < self.width and 0 <= y < self.height:
-                    draw.ellipse([x - size, y - size, x + size, y + size], fill=color)
-                    new_particles.append(particle)
+            # vx, vy drawn per particle
+            rand = self._rng.random((len(spawn), 2))
+            vx = (rand[:, 0] - 0.5) * 5
+            vy = -rand[:, 1] * 5
+            
+            colors = self.get_colors(normalized_bands)[spawn]
+            sizes = np.full(len(spawn), 3, dtype=np.int32)
+            self.particles.spawn(x, y, vx, vy, colors, sizes)
         
-        self.particles = new_particles
+        # Update and draw particles
+        self.particles.update_and_draw(draw, self.width, self.height)
         
         return img
 
@@ -720,18 +820,13 @@ class ModernGradientBarsVisualizer(BaseVisualizer):
         draw = ImageDraw.Draw(img)
         
         # Normalize bands
-        if np.max(bands) > 0:
-            normalized_bands = bands / np.max(bands)
-        else:
-            normalized_bands = bands
+        normalized_bands = self._normalize(bands)
         
-        for i, magnitude in enumerate(normalized_bands):
-            bar_height = int(magnitude * self.height * 0.8)
+        colors = [tuple(c) for c in self.get_colors(normalized_bands).tolist()]
+        bar_heights = (normalized_bands * self.height * 0.8).astype(np.int64).tolist()
+        for i, (bar_height, color) in enumerate(zip(bar_heights, colors)):
             x = i * bar_width + bar_spacing
             
-            # Get color
-            color = self.get_color(i, num_bands, magnitude)
-            
             # Draw rounded rectangle
             # Ensure bar_height doesn't exceed height and coordinates are valid
             bar_height = min(bar_height, self.height)
@@ -791,10 +886,7 @@ class PulseRingVisualizer(BaseVisualizer):
         draw = ImageDraw.Draw(img)
         
         # Normalize bands
-        if np.max(bands) > 0:
-            normalized_bands = bands / np.max(bands)
-        else:
-            normalized_bands = bands
+        normalized_bands = self._normalize(bands)
         
         # Get bass energy (low frequencies)
         bass_energy = np.mean(normalized_bands[:len(normalized_bands)//4])
@@ -851,10 +943,7 @@ class FrequencyDotsVisualizer(BaseVisualizer):
         draw = ImageDraw.Draw(img)
         
         # Normalize bands
-        if np.max(bands) > 0:
-            normalized_bands = bands / np.max(bands)
-        else:
-            normalized_bands = bands
+        normalized_bands = self._normalize(bands)
         
         # Grid configuration
         num_bands = len(bands)
@@ -864,25 +953,22 @@ class FrequencyDotsVisualizer(BaseVisualizer):
         cell_width = self.width // cols
         cell_height = self.height // rows
         
-        for col in range(cols):
-            if col >= len(normalized_bands):
-                break
-                
-            magnitude = normalized_bands[col]
-            
-            # Number of active dots in column based on magnitude
-            active_rows = int(magnitude * rows)
+        # Number of active dots in each column and dot size based on magnitude
+        magnitudes = normalized_bands[:cols]
+        active_rows = (magnitudes * rows).astype(np.int64).tolist()
+        dot_sizes = (5 + magnitudes * 10).astype(np.int64).tolist()
+        
+        # Color based on frequency
+        colors = [tuple(c) for c in self.get_colors(magnitudes).tolist()]
+        
+        for col in range(len(magnitudes)):
+            x = col * cell_width + cell_width // 2
+            dot_size = dot_sizes[col]
+            color = colors[col]
             
-            for row in range(active_rows):
-                x = col * cell_width + cell_width // 2
+            for row in range(active_rows[col]):
                 y = self.height - (row * cell_height) - cell_height // 2
                 
-                # Dot size based on magnitude
-                dot_size = int(5 + magnitude * 10)
-                
-                # Color based on frequency
-                color = self.get_color(col, cols, magnitude)
-                
                 draw.ellipse([x - dot_size, y - dot_size, x + dot_size, y + dot_size], 
                            fill=color)
         
@@ -3,11 +3,16 @@ Main window for MP3 Spectrum Visualizer application.
 """
 
 import os
+import copy
+import json
+import hashlib
+from collections import OrderedDict
+import numpy as np
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
     QLabel, QFileDialog, QSlider, QCheckBox, QComboBox, QLineEdit,
     QTextEdit, QGroupBox, QColorDialog, QProgressBar, QMessageBox,
-    QScrollArea, QGridLayout, QTabWidget
+    QScrollArea, QGridLayout, QTabWidget, QDialog
 )
 from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer
 from PyQt5.QtGui import QColor
@@ -38,6 +43,7 @@ class VideoGenerationThread(QThread):
         self.video_generator = video_generator
         self.output_path = output_path
         self.preview_seconds = preview_seconds
+        self._last_emit_pct = -1
     
     def run(self):
         """Run video generation."""
@@ -46,7 +52,12 @@ class VideoGenerationThread(QThread):
         
         try:
             def progress_callback(current, total):
-                self.progress.emit(current, total)
+                # The progress bar shows whole percents; only wake the GUI
+                # thread when the value it displays changes
+                pct = current * 100 // max(total, 1)
+                if pct != self._last_emit_pct or current >= total:
+                    self._last_emit_pct = pct
+                    self.progress.emit(current, total)
             
             logger.info(f"Starting video generation: {self.output_path}")
             if self.preview_seconds:
@@ -72,6 +83,15 @@ class VideoGenerationThread(QThread):
 class MainWindow(QMainWindow):
     """Main application window."""
     
+    # Rendered previews kept for revisited settings (least recently used
+    # first). The playing preview is the newest entry, not a copy, so the
+    # budget (two 1080p fast previews) keeps about one earlier preview.
+    PREVIEW_CACHE_SIZE = 8
+    PREVIEW_CACHE_MAX_BYTES = 2 * 45 * 1920 * 1080 * 3
+    # Largest preview held in one preallocated frame array; longer previews
+    # collect their frames one by one as they are rendered
+    PREVIEW_BUFFER_MAX_BYTES = 512 * 1024 ** 2
+    
     def __init__(self):
         """Initialize main window."""
         super().__init__()
@@ -79,11 +99,16 @@ class MainWindow(QMainWindow):
         self.audio_processor = None
         self.video_generator = None
         self.generation_thread = None
-        self.preview_frames = []
+        self.preview_frames = None
         self.preview_update_timer = QTimer()
         self.preview_update_timer.setSingleShot(True)
         self.preview_update_timer.timeout.connect(self.generate_preview_frames)
         self.auto_preview_enabled = True
+        # Incremented per preview request so stale renders can be dropped
+        self._preview_gen_id = 0
+        self._slider_dragging = False
+        self._preview_cache = OrderedDict()
+        self._color_dialog = None
         
         self.init_ui()
         self.load_settings()
@@ -441,9 +466,12 @@ class MainWindow(QMainWindow):
         self.blur_slider.setRange(0, 100)
         self.blur_slider.setValue(0)
         self.blur_slider.valueChanged.connect(self.update_blur_label)
+        self._defer_settings_while_dragging(self.blur_slider)
         self.blur_slider.setToolTip("Apply Gaussian blur to background (0-100). Higher values create stronger blur effect.")
         self.blur_label = QLabel("0")
-        self.blur_label.setMinimumWidth(40)
+        # Fixed size: text updates while dragging repaint only the label
+        # instead of relaying out the whole tab
+        self.blur_label.setFixedSize(40, self.blur_label.sizeHint().height())
         blur_slider_layout.addWidget(self.blur_slider)
         blur_slider_layout.addWidget(self.blur_label)
         blur_layout.addLayout(blur_slider_layout)
@@ -463,8 +491,9 @@ class MainWindow(QMainWindow):
         self.vignette_slider.setRange(0, 100)
         self.vignette_slider.setValue(0)
         self.vignette_slider.valueChanged.connect(self.update_vignette_label)
+        self._defer_settings_while_dragging(self.vignette_slider)
         self.vignette_label = QLabel("0")
-        self.vignette_label.setMinimumWidth(40)
+        self.vignette_label.setFixedSize(40, self.vignette_label.sizeHint().height())
         vignette_slider_layout.addWidget(self.vignette_slider)
         vignette_slider_layout.addWidget(self.vignette_label)
         vignette_layout.addLayout(vignette_slider_layout)
@@ -1170,12 +1199,32 @@ class MainWindow(QMainWindow):
         panel.setLayout(layout)
         return panel
     
+    def _pick_color(self, current_color, title):
+        """
+        Show the shared color dialog.
+        
+        One dialog is created on first use and reused by every color
+        picker instead of building a new one per click.
+        
+        Args:
+            current_color: Initial RGB color
+            title: Dialog window title
+            
+        Returns:
+            Selected QColor, invalid if the dialog was cancelled
+        """
+        if self._color_dialog is None:
+            self._color_dialog = QColorDialog(self)
+        self._color_dialog.setWindowTitle(title)
+        self._color_dialog.setCurrentColor(QColor(*current_color))
+        if self._color_dialog.exec_() == QDialog.Accepted:
+            return self._color_dialog.currentColor()
+        return QColor()
+    
     def choose_text_color(self):
         """Choose text overlay color."""
         current_color = self.settings_manager.get_setting('text_color', [255, 255, 255])
-        color = QColorDialog.getColor(
-            QColor(*current_color), self, "Choose Text Color"
-        )
+        color = self._pick_color(current_color, "Choose Text Color")
         if color.isValid():
             rgb = [color.red(), color.green(), color.blue()]
             self.settings_manager.set_setting('text_color', rgb)
@@ -1595,9 +1644,7 @@ class MainWindow(QMainWindow):
     def choose_background_color(self):
         """Choose solid background color."""
         current_color = self.settings_manager.get_setting('background_color', [0, 0, 0])
-        color = QColorDialog.getColor(
-            QColor(*current_color), self, "Choose Background Color"
-        )
+        color = self._pick_color(current_color, "Choose Background Color")
         if color.isValid():
             rgb = [color.red(), color.green(), color.blue()]
             self.settings_manager.set_setting('background_color', rgb)
@@ -1632,6 +1679,7 @@ class MainWindow(QMainWindow):
             try:
                 self.audio_processor = AudioProcessor(mp3_path)
                 self.audio_processor.load_audio()
+                self._preview_cache.clear()
                 duration = self.audio_processor.get_duration()
                 self.statusBar().showMessage(f"Audio loaded: {duration:.2f} seconds")
                 self.update_video_generator()
@@ -1652,6 +1700,20 @@ class MainWindow(QMainWindow):
             settings = self.settings_manager.settings.copy()
             self.video_generator = VideoGenerator(self.audio_processor, settings)
     
+    def _defer_settings_while_dragging(self, slider):
+        """Apply a slider's value once on release instead of on every drag step."""
+        slider.sliderPressed.connect(self._on_slider_pressed)
+        slider.sliderReleased.connect(self._on_slider_released)
+    
+    def _on_slider_pressed(self):
+        """Suspend settings updates while a slider is dragged."""
+        self._slider_dragging = True
+    
+    def _on_slider_released(self):
+        """Apply the final slider value once the drag ends."""
+        self._slider_dragging = False
+        self.update_settings()
+    
     def update_blur_label(self, value):
         """Update blur label."""
         self.blur_label.setText(str(value))
@@ -1817,9 +1879,7 @@ class MainWindow(QMainWindow):
     def choose_strobe_color(self):
         """Choose strobe color."""
         current_color = self.settings_manager.get_setting('strobe_color', [255, 255, 255])
-        color = QColorDialog.getColor(
-            QColor(*current_color), self, "Choose Strobe Color"
-        )
+        color = self._pick_color(current_color, "Choose Strobe Color")
         if color.isValid():
             rgb = [color.red(), color.green(), color.blue()]
             self.settings_manager.set_setting('strobe_color', rgb)
@@ -1827,6 +1887,10 @@ class MainWindow(QMainWindow):
     
     def update_settings(self):
         """Update settings from UI controls."""
+        # Dragged sliders apply their value once on release
+        if self._slider_dragging:
+            return
+        
         # Background type
         if hasattr(self, 'bg_type_combo'):
             bg_type = self.bg_type_combo.currentText().lower().replace(' ', '_')
@@ -1951,26 +2015,47 @@ class MainWindow(QMainWindow):
             
             num_frames = min(num_frames, max_preview_frames)
             
-            self.preview_frames = []
+            # Newer requests supersede renders that are still in flight
+            self._preview_gen_id += 1
+            gen_id = self._preview_gen_id
+            
+            self.preview_frames = None
             was_playing = self.preview_widget.is_playing_preview()
             
+            # Reuse the frames of a previously rendered identical configuration
+            cache_key = self._preview_cache_key(num_frames, frame_rate, fast_preview)
+            if cache_key in self._preview_cache:
+                self._preview_cache.move_to_end(cache_key)
+                self.on_preview_frames_ready(self._preview_cache[cache_key], frame_rate,
+                                             was_playing, gen_id)
+                return
+            
             # Generate frames in a separate thread to avoid blocking UI
             class PreviewFrameGenerator(QThread):
-                frames_ready = pyqtSignal(list, int)
+                frames_ready = pyqtSignal(object, int)
                 
-                def __init__(self, video_generator, num_frames, frame_rate, fast_mode=False):
-                    super().__init__()
+                def __init__(self, video_generator, num_frames, frame_rate, fast_mode=False,
+                             is_stale=None, parent=None):
+                    super().__init__(parent)
                     self.video_generator = video_generator
                     self.num_frames = num_frames
                     self.frame_rate = frame_rate
                     self.fast_mode = fast_mode
+                    self.is_stale = is_stale or (lambda: False)
                 
                 def run(self):
-                    frames = []
+                    # One contiguous (num_frames, height, width, 3) buffer when
+                    # it fits the budget (allocated once the first frame gives
+                    # the size), otherwise a list of per-frame arrays
+                    frames = None
+                    count = 0
                     # In fast mode, scale frame numbers to sample from full timeline
                     full_frame_rate = self.video_generator.frame_rate
                     
                     for i in range(self.num_frames):
+                        # A newer preview request replaces this one
+                        if self.is_stale():
+                            return
                         try:
                             # Map preview frame to actual video frame
                             if self.fast_mode:
@@ -1990,19 +2075,44 @@ class MainWindow(QMainWindow):
                                 # Scale back up (preview widget will handle final sizing)
                                 frame = frame.resize((width, height), Image.Resampling.NEAREST)
                             
-                            frames.append(frame)
+                            if frame.mode != 'RGB':
+                                frame = frame.convert('RGB')
+                            if frames is None:
+                                frame_bytes = frame.width * frame.height * 3
+                                if self.num_frames * frame_bytes <= MainWindow.PREVIEW_BUFFER_MAX_BYTES:
+                                    frames = np.empty((self.num_frames, frame.height, frame.width, 3),
+                                                      dtype=np.uint8)
+                                else:
+                                    frames = []
+                            if isinstance(frames, list):
+                                frames.append(np.asarray(frame))
+                            else:
+                                frames[i] = np.asarray(frame)
+                            count = i + 1
                         except Exception as e:
                             from core.logger import get_logger
                             logger = get_logger()
                             logger.error(f"Error generating preview frame {i}: {e}", exc_info=True)
                             break
-                    self.frames_ready.emit(frames, self.frame_rate)
+                    if frames is None:
+                        frames = []
+                    if not self.is_stale():
+                        self.frames_ready.emit(frames[:count], self.frame_rate)
             
+            # The preview renders on its own generator so it never shares
+            # video captures or render state with a running export
             self.preview_generator_thread = PreviewFrameGenerator(
-                self.video_generator, num_frames, frame_rate, fast_preview
+                copy.copy(self.video_generator), num_frames, frame_rate, fast_preview,
+                is_stale=lambda: self._preview_gen_id != gen_id, parent=self
+            )
+            # The window owns the thread, so a superseded render can finish
+            # after the reference is replaced
+            self.preview_generator_thread.finished.connect(
+                self.preview_generator_thread.deleteLater
             )
             self.preview_generator_thread.frames_ready.connect(
-                lambda frames, fr: self.on_preview_frames_ready(frames, fr, was_playing)
+                lambda frames, fr: self.on_preview_frames_ready(frames, fr, was_playing, gen_id,
+                                                                num_frames, cache_key)
             )
             self.preview_generator_thread.start()
             
@@ -2011,10 +2121,78 @@ class MainWindow(QMainWindow):
             logger = get_logger()
             logger.error(f"Error generating preview frames: {e}", exc_info=True)
     
-    def on_preview_frames_ready(self, frames, frame_rate, was_playing):
+    def _preview_cache_key(self, num_frames, frame_rate, fast_preview):
+        """
+        Build the preview cache key for the current settings.
+        
+        Args:
+            num_frames: Number of preview frames
+            frame_rate: Preview frame rate
+            fast_preview: Whether fast preview mode is enabled
+            
+        Returns:
+            Digest of the settings, referenced file times and preview parameters
+        """
+        payload = json.dumps([self.settings_manager.settings, self._referenced_file_mtimes(),
+                              num_frames, frame_rate, fast_preview],
+                             sort_keys=True, default=str)
+        return hashlib.blake2b(payload.encode(), digest_size=16).digest()
+    
+    def _referenced_file_mtimes(self):
+        """
+        Get the modification times of the files named in the settings.
+        
+        Keys the preview cache on file contents as well, so replacing a
+        background, logo or overlay file at the same path renders again.
+        
+        Returns:
+            Dictionary of path to modification time for existing files
+        """
+        paths = []
+        for key, value in self.settings_manager.settings.items():
+            if key.endswith('_path') and value:
+                paths.append(value)
+            elif key.endswith('_paths') and value:
+                paths.extend(value)
+        
+        mtimes = {}
+        for path in paths:
+            try:
+                mtimes[path] = os.path.getmtime(path)
+            except (OSError, TypeError):
+                continue
+        return mtimes
+    
+    def _cache_preview_frames(self, cache_key, frames):
+        """
+        Store rendered preview frames, evicting the least recently used.
+        
+        Args:
+            cache_key: Key from _preview_cache_key
+            frames: Rendered frames array
+        """
+        # Previews too long for one frame array are not kept
+        if not isinstance(frames, np.ndarray) or frames.nbytes > self.PREVIEW_CACHE_MAX_BYTES:
+            return
+        self._preview_cache[cache_key] = frames
+        self._preview_cache.move_to_end(cache_key)
+        total_bytes = sum(cached.nbytes for cached in self._preview_cache.values())
+        while (len(self._preview_cache) > self.PREVIEW_CACHE_SIZE
+               or total_bytes > self.PREVIEW_CACHE_MAX_BYTES):
+            _, evicted = self._preview_cache.popitem(last=False)
+            total_bytes -= evicted.nbytes
+    
+    def on_preview_frames_ready(self, frames, frame_rate, was_playing, gen_id=None,
+                                num_frames=None, cache_key=None):
         """Handle preview frames ready signal."""
+        # Drop frames from a render that a newer request superseded
+        if gen_id is not None and gen_id != self._preview_gen_id:
+            return
+        # Only complete renders are reused
+        if cache_key is not None and len(frames) == num_frames:
+            self._cache_preview_frames(cache_key, frames)
         self.preview_frames = frames
-        if frames:
+        if len(frames):
             self.preview_widget.set_frames(frames, frame_rate)
             self.play_preview_btn.setEnabled(True)
             if was_playing:
@@ -2027,7 +2205,7 @@ class MainWindow(QMainWindow):
             self.preview_widget.pause()
             self.play_preview_btn.setText("▶ Play")
         else:
-            if not self.preview_frames:
+            if self.preview_frames is None or not len(self.preview_frames):
                 # Generate frames if not available
                 self.generate_preview_frames()
             else:
@@ -6,8 +6,8 @@ from PyQt5.QtWidgets import QWidget, QLabel, QVBoxLayout
 from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtGui import QPixmap, QImage
 from PIL import Image
-import io
-from typing import List, Optional
+import numpy as np
+from typing import Optional, Sequence
 
 
 class PreviewWidget(QWidget):
@@ -21,7 +21,7 @@ class PreviewWidget(QWidget):
             parent: Parent widget
         """
         super().__init__(parent)
-        self.frames: List[Image.Image] = []
+        self.frames: Optional[Sequence[np.ndarray]] = None
         self.current_frame_index = 0
         self.is_playing = False
         self.frame_rate = 30
@@ -50,27 +50,32 @@ class PreviewWidget(QWidget):
         layout.addWidget(self.preview_label)
         self.setLayout(layout)
     
-    def set_frames(self, frames: List[Image.Image], frame_rate: int = 30):
+    def set_frames(self, frames: Sequence[np.ndarray], frame_rate: int = 30):
         """
         Set frames for preview playback.
         
         Args:
-            frames: List of PIL Images
+            frames: RGB frames of shape (height, width, 3), uint8, either
+                stacked in one array or as a list
             frame_rate: Frame rate for playback
         """
         self.frames = frames
         self.frame_rate = frame_rate
         self.current_frame_index = 0
         
-        if self.frames:
-            self.display_frame(self.frames[0])
+        if self.has_frames():
+            self.display_array(self.frames[0])
             # Update timer interval based on frame rate
             interval = int(1000 / frame_rate)  # milliseconds
             self.timer.setInterval(interval)
     
+    def has_frames(self) -> bool:
+        """Check if preview frames are loaded."""
+        return self.frames is not None and len(self.frames) > 0
+    
     def play(self):
         """Start playing preview frames."""
-        if self.frames and not self.is_playing:
+        if self.has_frames() and not self.is_playing:
             self.is_playing = True
             self.timer.start()
     
@@ -84,16 +89,16 @@ class PreviewWidget(QWidget):
         """Stop preview playback and reset to first frame."""
         self.pause()
         self.current_frame_index = 0
-        if self.frames:
-            self.display_frame(self.frames[0])
+        if self.has_frames():
+            self.display_array(self.frames[0])
     
     def next_frame(self):
         """Display next frame in sequence."""
-        if not self.frames:
+        if not self.has_frames():
             return
         
         self.current_frame_index = (self.current_frame_index + 1) % len(self.frames)
-        self.display_frame(self.frames[self.current_frame_index])
+        self.display_array(self.frames[self.current_frame_index])
     
     def is_playing_preview(self) -> bool:
         """Check if preview is currently playing."""
@@ -109,40 +114,35 @@ class PreviewWidget(QWidget):
         if pil_image is None:
             return
         
-        # Convert PIL Image to QPixmap
+        # Convert to RGB if needed
+        if pil_image.mode != 'RGB':
+            pil_image = pil_image.convert('RGB')
+        self.display_array(np.asarray(pil_image))
+    
+    def display_array(self, frame: np.ndarray):
+        """
+        Display an RGB frame in the preview.
+        
+        The QImage wraps the frame buffer without copying and Qt scales it
+        to the label size.
+        
+        Args:
+            frame: RGB pixels, shape (height, width, 3), uint8
+        """
         try:
+            frame = np.ascontiguousarray(frame)
+            img_height, img_width = frame.shape[:2]
+            qimage = QImage(frame.data, img_width, img_height, 3 * img_width,
+                            QImage.Format_RGB888)
+            
             # Resize to fit preview while maintaining aspect ratio
             preview_width = self.preview_label.width()
             preview_height = self.preview_label.height()
-            
             if preview_width > 0 and preview_height > 0:
-                # Calculate aspect ratio preserving size
-                img_width, img_height = pil_image.size
-                aspect_ratio = img_width / img_height
-                
-                if preview_width / preview_height > aspect_ratio:
-                    display_height = preview_height
-                    display_width = int(preview_height * aspect_ratio)
-                else:
-                    display_width = preview_width
-                    display_height = int(preview_width / aspect_ratio)
-                
-                pil_image = pil_image.resize((display_width, display_height), Image.Resampling.LANCZOS)
-            
-            # Convert to RGB if needed
-            if pil_image.mode != 'RGB':
-                pil_image = pil_image.convert('RGB')
-            
-            # Convert to bytes
-            img_bytes = io.BytesIO()
-            pil_image.save(img_bytes, format='PNG')
-            img_bytes.seek(0)
-            
-            # Create QImage from bytes
-            qimage = QImage()
-            qimage.loadFromData(img_bytes.read())
+                qimage = qimage.scaled(preview_width, preview_height,
+                                       Qt.KeepAspectRatio, Qt.SmoothTransformation)
             
-            # Convert to QPixmap and display
+            # Convert to QPixmap (copies the pixels) and display
             pixmap = QPixmap.fromImage(qimage)
             self.preview_label.setPixmap(pixmap)
         except Exception as e:
@@ -3,6 +3,7 @@ Main entry point for MP3 Spectrum Visualizer application.
 """
 
 import sys
+import multiprocessing
 from PyQt5.QtWidgets import QApplication
 from gui.main_window import MainWindow
 
@@ -19,6 +20,8 @@ def main():
 
 
 if __name__ == '__main__':
+    # Required for frame worker processes in frozen builds
+    multiprocessing.freeze_support()
     main()
 
 
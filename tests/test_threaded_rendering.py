@@ -0,0 +1,65 @@
+"""
+Regression test: frames rendered by several threads sharing one
+VideoGenerator match frames rendered by a single thread.
+"""
+
+import threading
+
+import numpy as np
+import pytest
+from PIL import Image
+from scipy.io import wavfile
+
+from core.audio_processor import AudioProcessor
+from core.settings import SettingsManager
+from core.video_generator import VideoGenerator
+
+
+NUM_FRAMES = 60
+
+
+@pytest.fixture
+def settings(tmp_path):
+    """Settings with a background image, text overlay and text logo."""
+    sample_rate = 22050
+    t = np.arange(int(sample_rate * 3)) / sample_rate
+    tone = 0.5 * np.sin(2 * np.pi * 440 * t) * (0.5 + 0.5 * np.sin(2 * np.pi * 2 * t))
+    audio_path = tmp_path / 'tone.wav'
+    wavfile.write(audio_path, sample_rate, tone.astype(np.float32))
+
+    background_path = tmp_path / 'background.png'
+    gradient = np.linspace(0, 255, 320 * 180 * 3).reshape(180, 320, 3).astype(np.uint8)
+    Image.fromarray(gradient).save(background_path)
+
+    return dict(SettingsManager.DEFAULT_SETTINGS,
+                mp3_path=str(audio_path),
+                video_width=320, video_height=180, resolution='custom',
+                background_type='image', background_path=str(background_path),
+                vignette_intensity=40, text_overlay='Hello', logo_text='LOGO',
+                visualizer_style='bars')
+
+
+def test_threads_sharing_a_generator_render_identical_frames(settings):
+    audio_processor = AudioProcessor(settings['mp3_path'])
+    reference_generator = VideoGenerator(audio_processor, settings)
+    reference = [np.asarray(reference_generator.generate_frame(i)).copy()
+                 for i in range(NUM_FRAMES)]
+
+    generator = VideoGenerator(audio_processor, settings)
+    results = [[None] * NUM_FRAMES for _ in range(2)]
+
+    def render(thread_index):
+        for frame_number in range(NUM_FRAMES):
+            frame = generator.generate_frame(frame_number)
+            results[thread_index][frame_number] = np.asarray(frame).copy()
+
+    threads = [threading.Thread(target=render, args=(i,)) for i in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    mismatched = [(thread_index, frame_number)
+                  for thread_index in range(2) for frame_number in range(NUM_FRAMES)
+                  if not np.array_equal(results[thread_index][frame_number], reference[frame_number])]
+    assert mismatched == []